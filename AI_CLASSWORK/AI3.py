@@ -83,23 +83,103 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtGui import QFont
 from PyQt6.QtCore import Qt
-from collections import deque
-import heapq
+from contextlib import contextmanager
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional, the kernel also runs as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
 
 ROWS, COLS = 10, 10
 
+
+# DFS kernel over a CSR adjacency: the walkable neighbors of cell i are
+# data[offsets[i]:offsets[i + 1]]. It only touches NumPy arrays so Numba can
+# compile it; without Numba it runs as ordinary Python.
+@njit(cache=True)
+def dfs_flat(offsets, data, start, goal, parent, visited, stack):
+    stack[0] = start
+    top = 1
+    visited[start] = 1
+    while top > 0:
+        top -= 1
+        current = stack[top]
+        if current == goal:
+            return True
+        for k in range(offsets[current], offsets[current + 1]):
+            neighbor = data[k]
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                parent[neighbor] = current
+                stack[top] = neighbor
+                top += 1
+    return False
+
+
+# Bitmap BFS: bit r * COLS + c stands for one cell, so a whole frontier
+# moves one step with four shifts and a few masks
+ALL_CELLS = (1 << (ROWS * COLS)) - 1
+NOT_FIRST_COL = sum(1 << i for i in range(ROWS * COLS) if i % COLS != 0)
+NOT_LAST_COL = sum(1 << i for i in range(ROWS * COLS) if i % COLS != COLS - 1)
+
+
+def spread(bits):
+    return (((bits & NOT_LAST_COL) << 1) | ((bits & NOT_FIRST_COL) >> 1)
+            | ((bits << COLS) & ALL_CELLS) | (bits >> COLS))
+
+
+def bfs_bitmap(start, goal, wall_bits):
+    open_cells = ALL_CELLS & ~wall_bits
+    goal_bit = 1 << goal
+    frontier = visited = 1 << start
+    levels = [frontier]
+    while not frontier & goal_bit:
+        frontier = spread(frontier) & open_cells & ~visited
+        if not frontier:
+            return None
+        visited |= frontier
+        levels.append(frontier)
+
+    # Walk back from the goal through any neighbor on the previous level
+    path = [0] * len(levels)
+    current = goal
+    for k in range(len(levels) - 1, 0, -1):
+        path[k] = current
+        previous = spread(1 << current) & levels[k - 1]
+        current = (previous & -previous).bit_length() - 1
+    path[0] = start
+    return path
+
+
 class MazeSolver(QWidget):
+    # Prebuilt stylesheets so Qt only re-parses a style when a cell changes
+    QSS_EMPTY = "background-color: white; color: black"
+    QSS_WALL = "background-color: black; color: white"
+    QSS_START = "background-color: green; color: white"
+    QSS_GOAL = "background-color: red; color: white"
+    QSS_PATH = "background-color: lightblue; color: black"
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Maze Solver (BFS, DFS, UCS)")
         self.resize(800, 750)
 
         self.buttons = []
-        self.state = [[0 for _ in range(COLS)] for _ in range(ROWS)]
+        self.state = np.zeros((ROWS, COLS), dtype=np.uint8)
         self.start_pos = None
         self.goal_pos = None
         self.click_stage = 0
         self.wall_count = 0
+        self.wall_bits = 0  # bit r * COLS + c is set when that cell is a wall
+        self.path_cache = {}  # (algorithm, start, goal, wall_bits) -> path or None
+
+        # Search scratch buffers, shared by every solve and reset in place
+        self.parent_f = np.full(ROWS * COLS, -1, dtype=np.int32)
+        self.visited_f = np.zeros(ROWS * COLS, dtype=np.uint8)
+        self.queue_f = np.empty(ROWS * COLS, dtype=np.int32)
+        self.csr_wall_bits = None  # wall bitmap the cached adjacency was built for
 
         self.create_widgets()
         self.layout_widgets()
@@ -136,74 +216,129 @@ class MazeSolver(QWidget):
             for col in range(COLS):
                 btn = QPushButton("")
                 btn.setFixedSize(40, 40)
-                btn.setStyleSheet("background-color: white")
-                btn.clicked.connect(lambda checked, r=row, c=col: self.cell_clicked(r, c))
+                btn.setStyleSheet(self.QSS_EMPTY)
+                btn.current_style = self.QSS_EMPTY
+                btn.setProperty("row", row)
+                btn.setProperty("col", col)
+                btn.clicked.connect(self.on_cell_clicked)
                 btn.setFont(QFont("Arial", 12, QFont.Weight.Bold))
                 row_buttons.append(btn)
                 self.grid_layout.addWidget(btn, row, col)
             self.buttons.append(row_buttons)
+        # Same buttons in flat-index order for whole-grid passes
+        self.buttons_flat = [btn for row_buttons in self.buttons for btn in row_buttons]
+
+    def set_style(self, btn, style):
+        if btn.current_style is not style:
+            btn.setStyleSheet(style)
+            btn.current_style = style
+
+    def on_cell_clicked(self):
+        btn = self.sender()
+        self.cell_clicked(btn.property("row"), btn.property("col"))
 
     def cell_clicked(self, row, col):
         if self.click_stage == 0:
             self.start_pos = (row, col)
-            self.state[row][col] = 2
-            self.buttons[row][col].setStyleSheet("background-color: green; color: white")
+            self.state[row, col] = 2
+            self.set_style(self.buttons[row][col], self.QSS_START)
             self.buttons[row][col].setText("S")
             self.info_label.setText("Click to set Goal position.")
             self.click_stage = 1
         elif self.click_stage == 1 and (row, col) != self.start_pos:
             self.goal_pos = (row, col)
-            self.state[row][col] = 3
-            self.buttons[row][col].setStyleSheet("background-color: red; color: white")
+            self.state[row, col] = 3
+            self.set_style(self.buttons[row][col], self.QSS_GOAL)
             self.buttons[row][col].setText("G")
             self.info_label.setText("Click to place walls.")
             self.click_stage = 2
         elif self.click_stage >= 2:
             if (row, col) == self.start_pos or (row, col) == self.goal_pos:
                 return
-            if self.state[row][col] != 1:
-                self.state[row][col] = 1
-                self.buttons[row][col].setStyleSheet("background-color: black; color: white")
+            if self.state[row, col] != 1:
+                self.state[row, col] = 1
+                self.wall_bits |= 1 << self.cell_index((row, col))
+                self.path_cache.clear()
+                self.set_style(self.buttons[row][col], self.QSS_WALL)
                 self.buttons[row][col].setText("")
                 self.wall_count += 1
                 self.info_label.setText(f"Walls placed: {self.wall_count}")
 
-    def get_neighbors(self, pos):
-        r, c = pos
-        for dr, dc in [(-1,0), (1,0), (0,-1), (0,1)]:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < ROWS and 0 <= nc < COLS and self.state[nr][nc] != 1:
-                yield (nr, nc)
-
-    def draw_path_with_steps(self, parent, algorithm_name):
-        path = []
-        current = self.goal_pos
-        while current != self.start_pos:
-            path.append(current)
-            current = parent[current]
-        path.append(self.start_pos)
-        path.reverse()
-
-        # Reset all except walls first
-        for r in range(ROWS):
-            for c in range(COLS):
-                if self.state[r][c] == 0:
-                    self.buttons[r][c].setStyleSheet("background-color: white; color: black")
-                    self.buttons[r][c].setText("")
-
-        # Show start and goal clearly again
-        sr, sc = self.start_pos
-        gr, gc = self.goal_pos
-        self.buttons[sr][sc].setStyleSheet("background-color: green; color: white")
-        self.buttons[sr][sc].setText("S")
-        self.buttons[gr][gc].setStyleSheet("background-color: red; color: white")
-        self.buttons[gr][gc].setText("G")
-
-        # Number the path steps starting from 1
-        for step_num, (r, c) in enumerate(path):
-            if (r, c) != self.start_pos and (r, c) != self.goal_pos:
-                self.buttons[r][c].setStyleSheet("background-color: lightblue; color: black")
-                self.buttons[r][c].setText(str(step_num))
+    def cell_index(self, pos):
+        return pos[0] * COLS + pos[1]
+
+    def get_neighbors_idx(self, i):
+        walls = self.wall_bits
+        r, c = divmod(i, COLS)
+        if r > 0 and not (walls >> (i - COLS)) & 1:
+            yield i - COLS
+        if r < ROWS - 1 and not (walls >> (i + COLS)) & 1:
+            yield i + COLS
+        if c > 0 and not (walls >> (i - 1)) & 1:
+            yield i - 1
+        if c < COLS - 1 and not (walls >> (i + 1)) & 1:
+            yield i + 1
+
+    def build_adjacency(self):
+        # Walkable neighbors of every cell in CSR form, rebuilt only when the
+        # walls have changed since the last solve
+        if self.csr_wall_bits == self.wall_bits:
+            return
+        adj = [tuple(self.get_neighbors_idx(i)) for i in range(ROWS * COLS)]
+        self.adj_offsets = np.zeros(ROWS * COLS + 1, dtype=np.int32)
+        np.cumsum([len(nbs) for nbs in adj], out=self.adj_offsets[1:])
+        self.adj_data = np.array([nb for nbs in adj for nb in nbs], dtype=np.int32)
+        self.csr_wall_bits = self.wall_bits
+
+    def reset_search_buffers(self):
+        self.parent_f.fill(-1)
+        self.visited_f.fill(0)
+
+    def reconstruct_path(self, parent, end):
+        # Measure the chain first so the path can be filled back to front
+        length = 0
+        current = end
+        while current != -1:
+            length += 1
+            current = int(parent[current])
+        path = [0] * length
+        current = end
+        for k in range(length - 1, -1, -1):
+            path[k] = current
+            current = int(parent[current])
+        return path
+
+    @contextmanager
+    def batched_updates(self):
+        # Hold repaints while many cells change, then lay out the grid once
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)
+            self.grid_layout.update()
+
+    def draw_path_with_steps(self, path, algorithm_name):
+        with self.batched_updates():
+            # Reset all except walls first
+            for i in np.flatnonzero(self.state == 0):
+                btn = self.buttons_flat[i]
+                self.set_style(btn, self.QSS_EMPTY)
+                btn.setText("")
+
+            # Show start and goal clearly again
+            sr, sc = self.start_pos
+            gr, gc = self.goal_pos
+            self.set_style(self.buttons[sr][sc], self.QSS_START)
+            self.buttons[sr][sc].setText("S")
+            self.set_style(self.buttons[gr][gc], self.QSS_GOAL)
+            self.buttons[gr][gc].setText("G")
+
+            # Number the path steps starting from 1
+            for step_num, i in enumerate(path[1:-1], start=1):
+                btn = self.buttons_flat[i]
+                self.set_style(btn, self.QSS_PATH)
+                btn.setText(str(step_num))
 
         steps = len(path) - 1  # excluding start cell
         self.info_label.setText(
@@ -211,96 +346,72 @@ class MazeSolver(QWidget):
         )
 
     def solve_bfs(self):
-        self.clear_path()
-        if not self.start_pos or not self.goal_pos:
-            self.info_label.setText("Please set both Start and Goal positions.")
-            return
-
-        queue = deque([self.start_pos])
-        visited = {self.start_pos}
-        parent = {}
-
-        while queue:
-            current = queue.popleft()
-            if current == self.goal_pos:
-                self.draw_path_with_steps(parent, "BFS")
-                return
-            for neighbor in self.get_neighbors(current):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    parent[neighbor] = current
-                    queue.append(neighbor)
-
-        self.info_label.setText("No path found with BFS.")
+        self.solve_with("BFS", self.bfs_path)
 
     def solve_dfs(self):
-        self.clear_path()
-        if not self.start_pos or not self.goal_pos:
-            self.info_label.setText("Please set both Start and Goal positions.")
-            return
-
-        stack = [self.start_pos]
-        visited = {self.start_pos}
-        parent = {}
-
-        while stack:
-            current = stack.pop()
-            if current == self.goal_pos:
-                self.draw_path_with_steps(parent, "DFS")
-                return
-            for neighbor in self.get_neighbors(current):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    parent[neighbor] = current
-                    stack.append(neighbor)
-
-        self.info_label.setText("No path found with DFS.")
+        self.solve_with("DFS", self.dfs_path)
 
     def solve_ucs(self):
+        self.solve_with("UCS", self.ucs_path)
+
+    def solve_with(self, algorithm_name, search):
         self.clear_path()
         if not self.start_pos or not self.goal_pos:
             self.info_label.setText("Please set both Start and Goal positions.")
             return
 
-        heap = [(0, self.start_pos)]
-        visited = set()
-        parent = {}
-
-        while heap:
-            cost, current = heapq.heappop(heap)
-            if current == self.goal_pos:
-                self.draw_path_with_steps(parent, "UCS")
-                return
-            if current in visited:
-                continue
-            visited.add(current)
-            for neighbor in self.get_neighbors(current):
-                if neighbor not in visited:
-                    heapq.heappush(heap, (cost + 1, neighbor))
-                    if neighbor not in parent:
-                        parent[neighbor] = current
-
-        self.info_label.setText("No path found with UCS.")
+        # The wall bitmap identifies the maze, so a repeat solve is a lookup
+        key = (algorithm_name, self.cell_index(self.start_pos),
+               self.cell_index(self.goal_pos), self.wall_bits)
+        if key not in self.path_cache:
+            self.path_cache[key] = search()
+        path = self.path_cache[key]
+
+        if path is None:
+            self.info_label.setText(f"No path found with {algorithm_name}.")
+        else:
+            self.draw_path_with_steps(path, algorithm_name)
+
+    def bfs_path(self):
+        return bfs_bitmap(self.cell_index(self.start_pos),
+                          self.cell_index(self.goal_pos), self.wall_bits)
+
+    def dfs_path(self):
+        self.build_adjacency()
+        self.reset_search_buffers()
+        if dfs_flat(
+            self.adj_offsets, self.adj_data,
+            self.cell_index(self.start_pos), self.cell_index(self.goal_pos),
+            self.parent_f, self.visited_f, self.queue_f,
+        ):
+            return self.reconstruct_path(self.parent_f, self.cell_index(self.goal_pos))
+        return None
+
+    def ucs_path(self):
+        # Every step costs 1, so UCS expands cells in BFS order
+        return self.bfs_path()
 
     def clear_path(self):
         # Clear all path and reset buttons that are not walls/start/goal
-        for r in range(ROWS):
-            for c in range(COLS):
-                if self.state[r][c] == 0:
-                    self.buttons[r][c].setStyleSheet("background-color: white; color: black")
-                    self.buttons[r][c].setText("")
+        with self.batched_updates():
+            for i in np.flatnonzero(self.state == 0):
+                btn = self.buttons_flat[i]
+                self.set_style(btn, self.QSS_EMPTY)
+                btn.setText("")
 
     def clear_grid(self):
-        self.state = [[0 for _ in range(COLS)] for _ in range(ROWS)]
+        self.state.fill(0)
         self.start_pos = None
         self.goal_pos = None
         self.click_stage = 0
         self.wall_count = 0
+        self.wall_bits = 0
+        self.path_cache.clear()
         self.info_label.setText("Click to set Start, Goal, and Walls")
-        for r in range(ROWS):
-            for c in range(COLS):
-                self.buttons[r][c].setStyleSheet("background-color: white; color: black")
-                self.buttons[r][c].setText("")
+        with self.batched_updates():
+            for btn in self.buttons_flat:
+                self.set_style(btn, self.QSS_EMPTY)
+                btn.setText("")
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
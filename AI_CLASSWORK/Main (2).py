@@ -1,6 +1,5 @@
 import sys
 import heapq
-import itertools
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -14,8 +13,6 @@ CELL_SIZE = 25
 GRID_ROWS = 20
 GRID_COLS = 30
 
-pq_counter = itertools.count()
-
 class GridCells(QGraphicsRectItem):
     """
     Represents an individual cell in the grid for pathfinding visualization.
@@ -29,13 +26,30 @@ class GridCells(QGraphicsRectItem):
         self.setBrush(QColor('white'))
         self.setPen(QColor('black'))
         self.type = 'empty'
-        self.text_item = QGraphicsSimpleTextItem('', self)
-        self.text_item.setPos(3, 3)
-        self.text_item.setFont(QFont("Arial", 8))
-        self.text_item.setBrush(QColor("black"))
+        self.text_item = None
         self.setAcceptHoverEvents(True)
         self.hover_text = None
 
+    def ensure_text_item(self):
+        """
+        Creates the label item the first time the cell shows any text.
+        """
+        if self.text_item is None:
+            self.text_item = QGraphicsSimpleTextItem('', self)
+            self.text_item.setPos(3, 3)
+            self.text_item.setFont(QFont("Arial", 8))
+            self.text_item.setBrush(QColor("black"))
+        return self.text_item
+
+    def remove_text_item(self):
+        """
+        Drops the label item so empty cells have nothing extra to paint.
+        """
+        if self.text_item is not None:
+            if self.text_item.scene() is not None:
+                self.text_item.scene().removeItem(self.text_item)
+            self.text_item = None
+
     def set_type(self, cell_type):
         """
         Sets the type of the cell and updates its color.
@@ -51,10 +65,13 @@ class GridCells(QGraphicsRectItem):
         self.type = cell_type
         self.setBrush(QColor(color_map.get(cell_type, 'white')))
         if cell_type not in ('start', 'goal'):
-            self.text_item.setText("")
+            self.remove_text_item()
 
     def setText(self, text):
-        self.text_item.setText(text)
+        if text:
+            self.ensure_text_item().setText(text)
+        else:
+            self.remove_text_item()
 
     def hoverEnterEvent(self, event):
         if self.type in ('empty', 'start', 'goal', 'wall'):
@@ -79,7 +96,7 @@ class GridCells(QGraphicsRectItem):
         """
         Sets a step number label on the cell.
         """
-        self.text_item.setText(str(text))
+        self.ensure_text_item().setText(str(text))
 
 
 class Grid:
@@ -207,8 +224,11 @@ class PathfindingApp(QMainWindow):
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.step_visualization)
         self.path = []
+        # Index of the next path cell to colour
+        self.path_index = 0
         self.steps = []
         self.step_counter = 0
+        self.batch_per_tick = 1
         self.algorithm_running = False
 
         self.view.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -285,6 +305,9 @@ class PathfindingApp(QMainWindow):
             self.statusBar().showMessage("No path found!", 3000)
 
         self.step_counter = 0
+        self.path_index = 0
+        # Cells drawn per timer tick, so any search animates in about 60 ticks
+        self.batch_per_tick = max(1, (len(self.steps) + len(self.path)) // 60)
         if self.steps or self.path:
             self.timer.start(50)
         else:
@@ -306,6 +329,7 @@ class PathfindingApp(QMainWindow):
                 if cell.type not in ('start', 'goal'):
                     cell.setText("")
         self.path = []
+        self.path_index = 0
         self.steps = []
         self.algorithm_running = False
 
@@ -313,35 +337,45 @@ class PathfindingApp(QMainWindow):
         """
         Visualizes the pathfinding process step by step.
         """
-        if self.step_counter < len(self.steps):
-            current_cell = self.steps[self.step_counter]
-            if current_cell.type != 'start' and current_cell.type != 'goal':
-                current_cell.set_type('visited')
-            current_cell.set_step_label(self.step_counter)
-            self.step_counter += 1
-            self.step_label.setText(f"Steps: {self.step_counter}")
-        elif len(self.path) > 0:
-            current_path_cell = self.path.pop(0)
-            if current_path_cell.type != 'start' and current_path_cell.type != 'goal':
-                current_path_cell.set_type('path')
-        else:
-            self.timer.stop()
-            self.statusBar().showMessage("Pathfinding visualization complete!", 3000)
-            self.algorithm_running = False
-
-    def heuristic(self, a, b):
-        return abs(a.row - b.row) + abs(a.col - b.col)
+        for _ in range(self.batch_per_tick):
+            if self.step_counter < len(self.steps):
+                current_cell = self.steps[self.step_counter]
+                if current_cell.type != 'start' and current_cell.type != 'goal':
+                    current_cell.set_type('visited')
+                current_cell.set_step_label(self.step_counter)
+                self.step_counter += 1
+            elif self.path_index < len(self.path):
+                current_path_cell = self.path[self.path_index]
+                self.path_index += 1
+                if current_path_cell.type != 'start' and current_path_cell.type != 'goal':
+                    current_path_cell.set_type('path')
+            else:
+                self.timer.stop()
+                self.statusBar().showMessage("Pathfinding visualization complete!", 3000)
+                self.algorithm_running = False
+                break
+        self.step_label.setText(f"Steps: {self.step_counter}")
 
     def a_star_search(self, start, goal):
+        # Manhattan distance to the goal is inlined below with the goal's
+        # coordinates held in locals
+        goal_row, goal_col = goal.row, goal.col
         frontier = []
 
-        heapq.heappush(frontier, (0, next(pq_counter), start))
+        # Entries are (priority, row, col, cell); row/col break ties, so two
+        # cells are never compared directly
+        start_priority = abs(start.row - goal_row) + abs(start.col - goal_col)
+        heapq.heappush(frontier, (start_priority, start.row, start.col, start))
         came_from = {start: None}
         cost_so_far = {start: 0}
         visited_order = []
 
         while frontier:
-            current_priority, _, current = heapq.heappop(frontier)
+            current_priority, _, _, current = heapq.heappop(frontier)
+
+            # Lazy deletion: skip entries left behind by a cheaper push
+            if current_priority != cost_so_far[current] + abs(current.row - goal_row) + abs(current.col - goal_col):
+                continue
 
             if current == goal:
                 break
@@ -353,8 +387,8 @@ class PathfindingApp(QMainWindow):
                 new_cost = cost_so_far[current] + 1
                 if next_node not in cost_so_far or new_cost < cost_so_far[next_node]:
                     cost_so_far[next_node] = new_cost
-                    priority = new_cost + self.heuristic(goal, next_node)
-                    heapq.heappush(frontier, (priority, next(pq_counter), next_node))
+                    priority = new_cost + abs(next_node.row - goal_row) + abs(next_node.col - goal_col)
+                    heapq.heappush(frontier, (priority, next_node.row, next_node.col, next_node))
                     came_from[next_node] = current
         return visited_order, came_from
 
@@ -363,13 +397,14 @@ class PathfindingApp(QMainWindow):
         Implements the Greedy Best-First Search algorithm.
         Returns a list of visited nodes and a dictionary of came_from pointers.
         """
+        goal_row, goal_col = goal.row, goal.col
         frontier = []
-        heapq.heappush(frontier, (0, next(pq_counter), start))
+        heapq.heappush(frontier, (0, start.row, start.col, start))
         came_from = {start: None}
         visited_order = []
 
         while frontier:
-            current_priority, _, current = heapq.heappop(frontier)
+            current_priority, _, _, current = heapq.heappop(frontier)
 
             if current == goal:
                 break
@@ -379,8 +414,8 @@ class PathfindingApp(QMainWindow):
 
             for next_node in self.grid.get_neighbors(current):
                 if next_node not in came_from:
-                    priority = self.heuristic(goal, next_node)
-                    heapq.heappush(frontier, (priority, next(pq_counter), next_node))
+                    priority = abs(next_node.row - goal_row) + abs(next_node.col - goal_col)
+                    heapq.heappush(frontier, (priority, next_node.row, next_node.col, next_node))
                     came_from[next_node] = current
         return visited_order, came_from
 
@@ -388,12 +423,17 @@ class PathfindingApp(QMainWindow):
         """
         Reconstructs the path from goal to start using the came_from dictionary.
         """
+        length = 0
         current = goal
-        path = []
-        while current != start:
-            if current is None:
-                break
-            path.insert(0, current)
+        while current != start and current is not None:
+            length += 1
+            current = came_from.get(current)
+
+        # Fill back to front instead of inserting at the head each time
+        path = [None] * length
+        current = goal
+        for i in range(length - 1, -1, -1):
+            path[i] = current
             current = came_from.get(current)
         return path
 
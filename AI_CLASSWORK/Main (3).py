@@ -1,15 +1,161 @@
 import sys
 from PyQt6.QtWidgets import (
-    QApplication, QWidget, QGridLayout, QLineEdit, QPushButton,
-    QMessageBox, QHBoxLayout, QVBoxLayout, QLabel
+    QApplication, QWidget, QLineEdit, QPushButton, QMessageBox, QHBoxLayout,
+    QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QStyledItemDelegate,
+    QHeaderView, QAbstractItemView
 )
 from PyQt6.QtGui import QIntValidator
 from PyQt6.QtCore import Qt
-import random
-import copy
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional, the solver also runs as plain Python
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+# Row, column and 3x3 box of each flat cell index 0..80, so the solver's
+# scans never divide
+ROW_OF = tuple(idx // 9 for idx in range(81))
+COL_OF = tuple(idx % 9 for idx in range(81))
+BOX_OF = tuple((idx // 27) * 3 + (idx % 9) // 3 for idx in range(81))
+
+
+@njit(cache=True)
+def popcount(mask):
+    count = 0
+    while mask:
+        mask &= mask - 1
+        count += 1
+    return count
+
+
+@njit(cache=True)
+def solve_grid(board):
+    """
+    Fills a 9x9 uint8 board in place by backtracking. Returns True if solved.
+    """
+    # Bit n of row_mask[r], col_mask[c] and box_mask[b] is set when digit n
+    # is already used in that row, column or 3x3 box
+    row_mask = np.zeros(9, dtype=np.uint16)
+    col_mask = np.zeros(9, dtype=np.uint16)
+    box_mask = np.zeros(9, dtype=np.uint16)
+    remaining = 0
+    for idx in range(81):
+        row, col = ROW_OF[idx], COL_OF[idx]
+        num = int(board[row, col])
+        if num == 0:
+            remaining += 1
+            continue
+        bit = 1 << num
+        box = BOX_OF[idx]
+        if (row_mask[row] | col_mask[col] | box_mask[box]) & bit:
+            return False  # the given digits already clash
+        row_mask[row] |= bit
+        col_mask[col] |= bit
+        box_mask[box] |= bit
+
+    # Iterative backtracking, since Numba handles an explicit stack far
+    # better than recursion. Each level holds a cell and the candidate
+    # digits it has not tried yet.
+    stack_cell = np.empty(81, dtype=np.int64)
+    stack_cands = np.empty(81, dtype=np.int64)
+    depth = 0
+    while True:
+        if remaining == 0:
+            return True
+
+        # Most constrained cell first; a cell with a single candidate (a
+        # naked single) is taken straight away and never branches
+        best, best_cands, best_count = -1, 0, 10
+        for idx in range(81):
+            row, col = ROW_OF[idx], COL_OF[idx]
+            if board[row, col] == 0:
+                box = BOX_OF[idx]
+                used = int(row_mask[row] | col_mask[col] | box_mask[box])
+                cands = 0x3FE & ~used
+                count = popcount(cands)
+                if count < best_count:
+                    best, best_cands, best_count = idx, cands, count
+                    if count <= 1:
+                        break
+        if best_count > 0:
+            stack_cell[depth] = best
+            stack_cands[depth] = best_cands
+            depth += 1
+            remaining -= 1
+
+        # Put the next untried digit in the top cell, popping cells that
+        # have run out of candidates
+        while True:
+            if depth == 0:
+                return False
+            idx = stack_cell[depth - 1]
+            row, col, box = ROW_OF[idx], COL_OF[idx], BOX_OF[idx]
+            num = int(board[row, col])
+            if num:
+                bit = 1 << num
+                row_mask[row] ^= bit
+                col_mask[col] ^= bit
+                box_mask[box] ^= bit
+                board[row, col] = 0
+            cands = stack_cands[depth - 1]
+            if cands == 0:
+                depth -= 1
+                remaining += 1
+                continue
+            bit = cands & -cands
+            stack_cands[depth - 1] = cands ^ bit
+            row_mask[row] |= bit
+            col_mask[col] |= bit
+            box_mask[box] |= bit
+            num = 1
+            while not (bit >> num) & 1:
+                num += 1
+            board[row, col] = num
+            break
+
+
+if HAVE_NUMBA:
+    # Compile once at import so the first click doesn't wait for the JIT
+    solve_grid(np.zeros((9, 9), dtype=np.uint8))
+
+
+class DigitDelegate(QStyledItemDelegate):
+    """
+    Edits grid cells with a one-character QLineEdit. All editors share a
+    single 1-9 validator owned by the delegate.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.validator = QIntValidator(1, 9, self)
+
+    def createEditor(self, parent, option, index):
+        editor = QLineEdit(parent)
+        editor.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        editor.setMaxLength(1)
+        editor.setValidator(self.validator)
+        return editor
 
 
 class SudokuSolver(QWidget):
+    # Any valid solution works here; new games are random symmetries of it
+    SEED_SOLUTION = np.array([
+        [1, 2, 3, 4, 5, 6, 7, 8, 9],
+        [4, 5, 6, 7, 8, 9, 1, 2, 3],
+        [7, 8, 9, 1, 2, 3, 4, 5, 6],
+        [2, 3, 4, 5, 6, 7, 8, 9, 1],
+        [5, 6, 7, 8, 9, 1, 2, 3, 4],
+        [8, 9, 1, 2, 3, 4, 5, 6, 7],
+        [3, 4, 5, 6, 7, 8, 9, 1, 2],
+        [6, 7, 8, 9, 1, 2, 3, 4, 5],
+        [9, 1, 2, 3, 4, 5, 6, 7, 8],
+    ], dtype=np.uint8)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Sudoku Solver with PyQt6")
@@ -27,20 +173,32 @@ class SudokuSolver(QWidget):
         self.main_layout.addWidget(title_label)
         self.main_layout.addWidget(instruction_label)
 
-        self.grid_layout = QGridLayout()
-        self.cells = [[QLineEdit(self) for _ in range(9)] for _ in range(9)]
-        self.hint_count = 0
-        self.max_hints = 5
+        # One table widget for the grid; self.cells holds its items so
+        # cells[row][col].text() / setText() work like the old line edits
+        self.table = QTableWidget(9, 9, self)
+        self.table.setStyleSheet("QTableWidget { font-size: 16px; }")
+        self.table.horizontalHeader().hide()
+        self.table.verticalHeader().hide()
+        for header in (self.table.horizontalHeader(), self.table.verticalHeader()):
+            header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+            header.setDefaultSectionSize(40)
+        self.table.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.table.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.table.setFixedSize(9 * 40 + 2, 9 * 40 + 2)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.AllEditTriggers)
+        self.table.setItemDelegate(DigitDelegate(self.table))
 
+        self.cells = []
         for row in range(9):
+            row_cells = []
             for col in range(9):
-                cell = self.cells[row][col]
-                cell.setFixedSize(40, 40)
-                cell.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                cell.setMaxLength(1)
-                cell.setStyleSheet("font-size: 16px;")
-                cell.setValidator(QIntValidator(1, 9, self))
-                self.grid_layout.addWidget(cell, row, col)
+                cell = QTableWidgetItem("")
+                cell.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                self.table.setItem(row, col, cell)
+                row_cells.append(cell)
+            self.cells.append(row_cells)
+        self.hint_count = 0
+        self.max_hints = 5
 
         self.hint_button = QPushButton(f"Get Hint ({self.max_hints - self.hint_count} left)")
         self.hint_button.clicked.connect(self.provide_hint)
@@ -60,7 +218,7 @@ class SudokuSolver(QWidget):
         button_layout.addWidget(clear_button)
         button_layout.addWidget(new_button)
 
-        self.main_layout.addLayout(self.grid_layout)
+        self.main_layout.addWidget(self.table, alignment=Qt.AlignmentFlag.AlignCenter)
         self.main_layout.addLayout(button_layout)
         self.setLayout(self.main_layout)
 
@@ -68,110 +226,90 @@ class SudokuSolver(QWidget):
         self.start_new_game()
 
     def get_board(self):
-        board = []
-        for row in range(9):
-            board_row = []
-            for col in range(9):
-                text = self.cells[row][col].text()
-                try:
-                    if text == '':
-                        board_row.append(0)
-                    elif text.isdigit():
-                        num = int(text)
-                        if 1 <= num <= 9:
-                            board_row.append(num)
-                        else:
-                            raise ValueError
-                    else:
-                        raise ValueError
-                except ValueError:
-                    QMessageBox.warning(self, "Invalid Input", f"Cell ({row+1}, {col+1}) contains an invalid entry.")
-                    return None
-            board.append(board_row)
-        return board
+        # The delegate's validator only lets "" or a single 1-9 digit through,
+        # so the 81 cells can be read as one digit string
+        digits = "".join(item.text() or "0" for row in self.cells for item in row)
+        return (np.frombuffer(digits.encode(), dtype=np.uint8) - ord("0")).reshape(9, 9)
 
     def set_board(self, board):
-        for row in range(9):
-            for col in range(9):
-                self.cells[row][col].setText(str(board[row][col]) if board[row][col] != 0 else "")
+        # One repaint for the whole grid, and only cells whose text changes
+        # are touched
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            for row in range(9):
+                for col in range(9):
+                    cell = self.cells[row][col]
+                    text = str(board[row, col]) if board[row, col] != 0 else ""
+                    if cell.text() != text:
+                        cell.setText(text)
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+            self.table.viewport().update()
 
     def clear_board(self):
-        for row in range(9):
-            for col in range(9):
-                self.cells[row][col].clear()
-                self.cells[row][col].setStyleSheet("font-size: 16px;")
+        self.set_board(np.zeros((9, 9), dtype=np.uint8))
         self.hint_count = 0
         self.hint_button.setText(f"Get Hint ({self.max_hints - self.hint_count} left)")
 
     def solve(self):
         board = self.get_board()
-        if board is None:
-            return
-        if self.solve_board(board):
+        # Entries that agree with the stored solution need no search at all
+        if self.solution is not None and np.all((board == 0) | (board == self.solution)):
+            self.set_board(self.solution)
+        elif solve_grid(board):
             self.set_board(board)
         else:
             QMessageBox.warning(self, "Unsolvable", "This Sudoku puzzle cannot be solved.")
 
-    def solve_board(self, board):
-        for row in range(9):
-            for col in range(9):
-                if board[row][col] == 0:
-                    for num in range(1, 10):
-                        if self.is_valid(board, row, col, num):
-                            board[row][col] = num
-                            if self.solve_board(board):
-                                return True
-                            board[row][col] = 0
-                    return False
-        return True
-
-    def is_valid(self, board, row, col, num):
-        for i in range(9):
-            if board[row][i] == num or board[i][col] == num:
-                return False
-        start_row, start_col = 3 * (row // 3), 3 * (col // 3)
-        for i in range(3):
-            for j in range(3):
-                if board[start_row + i][start_col + j] == num:
-                    return False
-        return True
-
     def provide_hint(self):
         if self.hint_count >= self.max_hints:
             QMessageBox.warning(self, "Hint Limit", "No more hints available.")
             return
 
         board = self.get_board()
-        if board is None:
-            return
 
         if self.solution is None:
-            board_copy = copy.deepcopy(board)
-            if not self.solve_board(board_copy):
+            board_copy = board.copy()
+            if not solve_grid(board_copy):
                 QMessageBox.warning(self, "Unsolvable", "This Sudoku puzzle cannot be solved.")
                 return
             self.solution = board_copy
 
         for row in range(9):
             for col in range(9):
-                if board[row][col] == 0:
-                    self.cells[row][col].setText(str(self.solution[row][col]))
+                if board[row, col] == 0:
+                    self.cells[row][col].setText(str(self.solution[row, col]))
                     self.hint_count += 1
                     self.hint_button.setText(f"Get Hint ({self.max_hints - self.hint_count} left)")
                     return
 
+    def random_solution(self):
+        """
+        Returns a fresh solved grid by applying validity-preserving shuffles
+        to SEED_SOLUTION instead of running the solver on an empty board.
+        """
+        # Relabel the digits
+        digits = np.random.permutation(9).astype(np.uint8) + 1
+        board = digits[self.SEED_SOLUTION - 1]
+
+        # Shuffle bands and stacks, and rows/columns within each of them
+        rows = np.concatenate([band * 3 + np.random.permutation(3) for band in np.random.permutation(3)])
+        cols = np.concatenate([stack * 3 + np.random.permutation(3) for stack in np.random.permutation(3)])
+        board = board[rows][:, cols]
+
+        if np.random.randint(2):
+            board = board.T
+        return np.ascontiguousarray(board)
+
     def start_new_game(self):
         self.clear_board()
-        full_board = [[0]*9 for _ in range(9)]
-        self.solve_board(full_board)
-
-        puzzle = copy.deepcopy(full_board)
-        cells_to_remove = 40
-        while cells_to_remove > 0:
-            row, col = random.randint(0, 8), random.randint(0, 8)
-            if puzzle[row][col] != 0:
-                puzzle[row][col] = 0
-                cells_to_remove -= 1
+        full_board = self.random_solution()
+
+        # Empty 40 distinct cells in one draw instead of retrying collisions
+        puzzle = full_board.copy()
+        puzzle.reshape(-1)[np.random.choice(81, 40, replace=False)] = 0
 
         self.solution = full_board
         self.set_board(puzzle)
@@ -10,6 +10,7 @@ class ColorMatchingGame:
         master.resizable(False, False) # Disable resizing
 
         self.colors = ["red", "orange", "yellow", "purple", "blue", "green", "brown", "white", "gray"]
+        self.color_set = frozenset(self.colors) # For constant-time membership checks
         self.current_grid_colors = []
         self.selected_indices = []
         self.matched_colors_count = 0
@@ -27,6 +28,8 @@ class ColorMatchingGame:
                 button.grid(row=i, column=j, padx=5, pady=5)
                 row_buttons.append(button)
             self.color_buttons.append(row_buttons)
+        # Row-major list of the same buttons, so grid-wide updates are a single pass
+        self.flat_buttons = [button for row in self.color_buttons for button in row]
 
         # --- Message Label ---
         self.message_label = tk.Label(master, text="Click 'New Game' to start!", font=("Arial", 12))
@@ -53,15 +56,11 @@ class ColorMatchingGame:
         self.matched_colors_count = 0
         self.message_label.config(text="Select colors to match!")
         self.update_grid()
-        self.enable_all_buttons()
-        self.reset_button_borders()
 
     def update_grid(self):
-        for i in range(3):
-            for j in range(3):
-                color_index = i * 3 + j
-                color = self.current_grid_colors[color_index]
-                self.color_buttons[i][j].config(bg=color, state=tk.NORMAL) # Set background color
+        # Colour, enable and reset the border of each button in one config call
+        for button, color in zip(self.flat_buttons, self.current_grid_colors):
+            button.config(bg=color, state=tk.NORMAL, relief="raised", bd=2)
 
     def on_button_click(self, row, col):
         index = row * 3 + col
@@ -96,18 +95,19 @@ class ColorMatchingGame:
         # A more common matching game would be to find pairs of identical colors, or match color names to colors.
         # For demonstration purposes, let's make it a "find all the colors in the original list" game.
 
-        correct_selection_count = 0
-        for selected_idx in self.selected_indices:
-            selected_color_name = self.current_grid_colors[selected_idx]
-            if selected_color_name in self.colors: # Check if the color is one of our base colors
-                correct_selection_count += 1
-        
-        if correct_selection_count == len(self.selected_indices) and len(self.selected_indices) == len(self.colors):
+        grid_colors = self.current_grid_colors
+        color_set = self.color_set
+        correct_selection_count = sum(1 for selected_idx in self.selected_indices
+                                      if grid_colors[selected_idx] in color_set) # Check if the color is one of our base colors
+        selected_count = len(self.selected_indices)
+        color_count = len(self.colors)
+
+        if correct_selection_count == selected_count and selected_count == color_count:
             self.message_label.config(text="Congratulations! All colors matched!")
             self.disable_all_buttons()
             messagebox.showinfo("Game Over", "You matched all colors!")
         elif correct_selection_count > 0:
-            self.message_label.config(text=f"You've matched {correct_selection_count} out of {len(self.colors)} potential colors. Keep going!")
+            self.message_label.config(text=f"You've matched {correct_selection_count} out of {color_count} potential colors. Keep going!")
         else:
             self.message_label.config(text="No new matches found. Try again!")
 
@@ -117,19 +117,16 @@ class ColorMatchingGame:
         self.message_label.config(text="Selection cleared.")
 
     def reset_button_borders(self):
-        for i in range(3):
-            for j in range(3):
-                self.color_buttons[i][j].config(relief="raised", bd=2) # Reset to default
+        for button in self.flat_buttons:
+            button.config(relief="raised", bd=2) # Reset to default
 
     def disable_all_buttons(self):
-        for i in range(3):
-            for j in range(3):
-                self.color_buttons[i][j].config(state=tk.DISABLED)
+        for button in self.flat_buttons:
+            button.config(state=tk.DISABLED)
 
     def enable_all_buttons(self):
-        for i in range(3):
-            for j in range(3):
-                self.color_buttons[i][j].config(state=tk.NORMAL)
+        for button in self.flat_buttons:
+            button.config(state=tk.NORMAL)
 
 
 if __name__ == "__main__":
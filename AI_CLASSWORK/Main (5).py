@@ -2,68 +2,105 @@ import sys
 import time
 import logging
 
+import numpy as np
+
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QPushButton,
     QLabel, QHBoxLayout, QLineEdit, QTableWidget, QDialog, QFormLayout,
     QGraphicsScene, QGraphicsItem, QGraphicsView, QMenu, QComboBox,
-    QTableWidgetItem
+    QTableWidgetItem, QGraphicsPathItem, QGraphicsSimpleTextItem, QSizePolicy
 )
 
-from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QFontMetrics, QIcon
-from PyQt6.QtCore import Qt, QRectF, QPointF, QTimer, QTime
+from PyQt6.QtGui import (
+    QPainter, QColor, QPen, QBrush, QFont, QIcon, QPainterPath,
+    QStandardItemModel, QStandardItem
+)
+from PyQt6.QtCore import Qt, QRectF, QTimer, QTime
 
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
-
-class ColorCell(QGraphicsItem):
+# Built once so painting never re-parses hex strings or allocates pens
+COLOR_MAP = {
+    name: QColor(hex_value) for name, hex_value in {
+        "red": "#FF0000", "orange": "#FFA500", "yellow": "#FFFF00",
+        "green": "#00FF00", "blue": "#0000FF", "purple": "#800080",
+        "black": "#000000", "white": "#FFFFFF", "brown": "#A52A2A" # Corrected brown hex
+    }.items()
+}
+DEFAULT_COLOR = QColor("#ADD8E6") # Light gray for unknown or empty color names
+MISMATCH_COLOR = QColor("#FF6347")
+FLASH_COLOR = QColor("#90EE90")
+BORDER_PEN = QPen(Qt.GlobalColor.black, 1.5)
+
+
+class ColorCell(QGraphicsPathItem):
+    # Qt draws the rounded background itself; the label is a cached child item,
+    # so flashing only swaps the brush and never re-lays out text
     def __init__(self, color_name, colors_list, parent_window, i, j, cell_size, parent=None):
         super().__init__(parent)
         self.original_color_name = color_name
-        self.display_color = self.get_color_rgb(color_name)
-        self.default_color = self.display_color
+        self.default_color = self.get_color_rgb(color_name)
         self.selected_color_name = None
         self.colors_list = colors_list
         self.parent_window = parent_window
         self.i = i
         self.j = j
-        self.cell_size = cell_size
+        self.cell_size = None
+        self.text_item = None  # Created on the first color pick
         self.toggle_state = False
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.toggle_flash_color)
+        self.setPen(BORDER_PEN)
+        self.set_display_color(self.default_color)
+        self.set_cell_size(cell_size)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, True)
         self.setAcceptedMouseButtons(Qt.MouseButton.LeftButton)
-        self.setAcceptHoverEvents(True)
+
+    def reset(self, color_name, colors_list):
+        # Reuse this cell for a new game instead of rebuilding the scene
+        self.original_color_name = color_name
+        self.colors_list = colors_list
+        self.default_color = self.get_color_rgb(color_name)
+        self.selected_color_name = None
+        self.toggle_state = False
+        self.set_label(None)
+        self.set_display_color(self.default_color)
+
+    def set_cell_size(self, cell_size):
+        if cell_size == self.cell_size:
+            return
+        self.cell_size = cell_size
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(-cell_size / 2, -cell_size / 2, cell_size, cell_size), 10, 10) # 10 for rounded corners
+        self.setPath(path)
+        self.font = QFont("Segoe UI", int(cell_size * 0.2), QFont.Weight.Medium)
+        if self.text_item:
+            self.text_item.setFont(self.font)
+            self.center_text()
+
+    def set_display_color(self, color):
+        self.display_color = color
+        self.setBrush(QBrush(color))
+
+    def set_label(self, text):
+        if not text:
+            if self.text_item:
+                self.text_item.hide()
+            return
+        if self.text_item is None:
+            self.text_item = QGraphicsSimpleTextItem(self)
+            self.text_item.setFont(self.font)
+            self.text_item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+            # Let clicks on the label reach the cell
+            self.text_item.setAcceptedMouseButtons(Qt.MouseButton.NoButton)
+        self.text_item.setText(text)
+        self.text_item.show()
+        self.center_text()
+
+    def center_text(self):
+        rect = self.text_item.boundingRect()
+        self.text_item.setPos(-rect.width() / 2, -rect.height() / 2)
 
     def get_color_rgb(self, color_name):
-        color_map = {
-            "red": "#FF0000", "orange": "#FFA500", "yellow": "#FFFF00",
-            "green": "#00FF00", "blue": "#0000FF", "purple": "#800080",
-            "black": "#000000", "white": "#FFFFFF", "brown": "#A52A2A" # Corrected brown hex
-        }
-        # Default to a light gray if color_name is not found or empty
-        return QColor(color_map.get(color_name.lower(), "#ADD8E6"))
-
-    def boundingRect(self):
-        return QRectF(-self.cell_size / 2, -self.cell_size / 2, self.cell_size, self.cell_size)
-
-    def paint(self, painter, option, widget=None):
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        pen = QPen(Qt.GlobalColor.black, 1.5)
-        painter.setPen(pen)
-
-        painter.setBrush(QBrush(self.display_color))
-        rect = self.boundingRect()
-        painter.drawRoundedRect(rect, 10, 10) # 10 for rounded corners
-
-        display_text = self.selected_color_name if self.selected_color_name else ""
-        if display_text:
-            painter.setPen(QPen(Qt.GlobalColor.black))
-            font = QFont("Segoe UI", int(self.cell_size * 0.2), QFont.Weight.Medium)
-            painter.setFont(font)
-            metrics = QFontMetrics(font)
-            text_width = metrics.horizontalAdvance(display_text)
-            painter.drawText(QPointF(-text_width / 2, 5), display_text)
+        return COLOR_MAP.get(color_name.lower(), DEFAULT_COLOR)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -73,7 +110,7 @@ class ColorCell(QGraphicsItem):
             # In this context, 'self' is already the item that received the click.
             # item = self.scene().itemAt(scene_pos, self.parent_window.view.transform())
             # if item: # This check is redundant for the item that received the event.
-            logging.debug(f"Cell clicked at ({self.i}, {self.j}), scene coordinates ({scene_pos.x():.2f}, {scene_pos.y():.2f})")
+            logging.debug("Cell clicked at (%d, %d), scene coordinates (%.2f, %.2f)", self.i, self.j, scene_pos.x(), scene_pos.y())
 
             menu = QMenu()
             for color in self.colors_list:
@@ -83,54 +120,47 @@ class ColorCell(QGraphicsItem):
             event.accept()
 
     def set_selected_color(self, color_name):
-        logging.debug(f"Setting selected color '{color_name}' for cell ({self.i}, {self.j})")
+        logging.debug("Setting selected color '%s' for cell (%d, %d)", color_name, self.i, self.j)
         self.selected_color_name = color_name
-        self.display_color = self.get_color_rgb(color_name)
-        self.update()
+        self.set_label(color_name)
+        self.set_display_color(self.get_color_rgb(color_name))
         if self.parent_window:
             self.parent_window.update_cell(self.i, self.j, color_name)
 
-    def evaluate_match(self, correct_color):
-        if self.selected_color_name == correct_color:
-            self.display_color = self.get_color_rgb(self.original_color_name) # Revert to original
-            self.update()
-            self.stop_flash()
-        else:
-            self.start_flash()
-
     def start_flash(self):
-        if not self.timer.isActive():
+        # Flashing cells share the window's timer instead of owning one each
+        if self not in self.parent_window.flashing:
             self.toggle_state = False # Ensure it starts from default color then flashes
-            self.timer.start(500) # Flash every 500 milliseconds
+            self.parent_window.flashing.add(self)
+            if not self.parent_window.flash_timer.isActive():
+                self.parent_window.flash_timer.start(500) # Flash every 500 milliseconds
 
     def stop_flash(self):
-        if self.timer.isActive():
-            self.timer.stop()
-            self.display_color = self.get_color_rgb(self.original_color_name) # Ensure it stops on original color
-            self.update()
+        if self in self.parent_window.flashing:
+            self.parent_window.flashing.discard(self)
+            if not self.parent_window.flashing:
+                self.parent_window.flash_timer.stop()
+            self.set_display_color(self.default_color) # Ensure it stops on original color
 
     def toggle_flash_color(self):
         if self.toggle_state:
-            self.display_color = QColor("#FF6347") # Red for mismatch
+            self.set_display_color(MISMATCH_COLOR) # Red for mismatch
         else:
-            self.display_color = QColor("#90EE90") # Green for match attempt/flash indication
+            self.set_display_color(FLASH_COLOR) # Green for match attempt/flash indication
         self.toggle_state = not self.toggle_state
-        self.update()
-
-    def hoverEnterEvent(self, event):
-        logging.debug(f"Mouse entered ColorCell at ({self.i}, {self.j})")
-        self.update()
-        super().hoverEnterEvent(event)
-
-    def hoverLeaveEvent(self, event):
-        logging.debug(f"Mouse left ColorCell at ({self.i}, {self.j})")
-        self.update()
-        super().hoverLeaveEvent(event)
 
 
 class TimeUpdater:
     def __init__(self, label):
         self.label = label
+        self.last_text = ""
+
+        # Size the label for the widest time up front so new text never changes its size hint
+        self.label.ensurePolished()
+        widest = self.label.fontMetrics().horizontalAdvance("CSP Color Matching Game - 00:00:00 PM 00, 0000")
+        self.label.setMinimumWidth(widest)
+        self.label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Fixed)
+
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_time)
         self.timer.start(1000) # Update every 1 second
@@ -138,7 +168,10 @@ class TimeUpdater:
 
     def update_time(self):
         current_time = time.strftime("%I:%M:%S %p %d, %Y", time.localtime())
-        self.label.setText(f"CSP Color Matching Game - {current_time}")
+        text = f"CSP Color Matching Game - {current_time}"
+        if text != self.last_text:
+            self.last_text = text
+            self.label.setText(text)
 
 
 class AdminDialog(QDialog):
@@ -162,25 +195,24 @@ class AdminDialog(QDialog):
         self.init_grid.setHorizontalHeaderLabels([str(i) for i in range(self.parent.size)])
         self.init_grid.setVerticalHeaderLabels([str(i) for i in range(self.parent.size)])
         
+        # One model of all available colors, shared by every combo box
+        self.color_model = QStandardItemModel(self)
+        for color in self.all_colors_list:
+            self.color_model.appendRow(QStandardItem(color))
+        color_index = {color: index for index, color in enumerate(self.all_colors_list)}
+        white_index = color_index.get("white", 0) # Default if a color is missing or not in the list
+
         # Populate the table with ComboBoxes
         for i in range(self.parent.size):
             for j in range(self.parent.size):
                 combo = QComboBox()
-                combo.addItems(self.all_colors_list) # Add all available colors
-                
+                combo.setModel(self.color_model)
+
                 # Set initial selection for the combo box
                 if self.init_colors and i < len(self.init_colors) and j < len(self.init_colors[i]):
-                    try:
-                        index = combo.findText(self.init_colors[i][j], Qt.MatchFlag.MatchExactly)
-                        if index != -1:
-                            combo.setCurrentIndex(index)
-                        else:
-                            combo.setCurrentText("white") # Default if initial color not in list
-                    except Exception as e:
-                        logging.warning(f"Error setting initial color for combo at ({i},{j}): {e}")
-                        combo.setCurrentText("white") # Fallback
+                    combo.setCurrentIndex(color_index.get(self.init_colors[i][j], white_index))
                 else:
-                    combo.setCurrentText("white") # Default if no initial colors provided
+                    combo.setCurrentIndex(white_index)
 
                 self.init_grid.setCellWidget(i, j, combo)
         layout.addWidget(self.init_grid)
@@ -195,10 +227,7 @@ class AdminDialog(QDialog):
         self.parent.size = size
         self.parent.colors = colors
         self.parent.init_colors = init_colors
-        
-        # Initialize user_grid with None for the new game
-        self.parent.user_grid = [[None for _ in range(self.parent.size)] for _ in range(self.parent.size)]
-        
+
         self.parent.generate_game() # Regenerate the game with new settings
         self.accept() # Close the dialog
 
@@ -208,7 +237,9 @@ class AdminDialog(QDialog):
         
         # Get colors from the comma-separated input field
         colors_text = self.colors_input.text()
-        colors = [c.strip() for c in colors_text.split(',') if c.strip()]
+        # Qt hands back fresh strings; interning them lets every later dict
+        # lookup of a color name match by identity
+        colors = [sys.intern(c.strip()) for c in colors_text.split(',') if c.strip()]
         if not colors: # Fallback if no colors are entered
             colors = ["red", "green", "blue", "yellow", "white", "black", "brown", "orange"]
 
@@ -219,7 +250,7 @@ class AdminDialog(QDialog):
             for j in range(self.parent.size):
                 combo = self.init_grid.cellWidget(i, j)
                 if isinstance(combo, QComboBox):
-                    color = combo.currentText()
+                    color = sys.intern(combo.currentText())
                 else:
                     color = "white" # Fallback if not a QComboBox
                 row.append(color)
@@ -238,8 +269,19 @@ class ColorMatchingWindow(QMainWindow):
         self.size = 3  # Default grid size
         self.colors = []  # Available colors for selection
         self.init_colors = []  # Initial colors of the grid cells (the target configuration)
-        self.user_grid = []  # User's selected colors for the grid
         self.cells = []  # References to ColorCell QGraphicsItems
+        self.color_codes = {}  # Color name -> small int code for array comparisons
+        # Target and picked colors as size x size arrays of codes; -1 marks a
+        # cell the user has not picked yet
+        self.init_codes = None
+        self.user_codes = None
+        self.flashing = set()  # Cells currently flashing a mismatch
+        self.relayout_pending = False  # A resize relayout is already queued
+        self.placed_geometry = None  # (view width, view height, size) the cells were placed for
+
+        # One timer drives every flashing cell
+        self.flash_timer = QTimer(self)
+        self.flash_timer.timeout.connect(self.tick_flash)
 
         self.setStyleSheet("""
             QLabel#HeaderLabel {
@@ -323,11 +365,22 @@ class ColorMatchingWindow(QMainWindow):
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        # Recalculate cell positions and sizes if necessary after resize
-        if self.init_colors: # Only regenerate if a game is active
-             self.generate_game()
+        # Coalesce a burst of resize events into one relayout
+        if self.cells and not self.relayout_pending: # Only relayout if a game is active
+            self.relayout_pending = True
+            QTimer.singleShot(50, self.relayout_cells)
+
+    def relayout_cells(self):
+        self.relayout_pending = False
+        viewport = self.view.viewport()
+        if (viewport.width(), viewport.height(), self.size) != self.placed_geometry:
+            self.place_cells()
 
 
+    def tick_flash(self):
+        for cell in self.flashing:
+            cell.toggle_flash_color()
+
     def show_admin_dialog(self):
         # Provide a default list of all possible colors to the AdminDialog
         all_possible_colors = ["red", "orange", "yellow", "green", "blue", "purple", "black", "white", "brown", "pink", "teal", "lime", "gray"]
@@ -349,74 +402,97 @@ class ColorMatchingWindow(QMainWindow):
             logging.warning("No initial colors set. Cannot generate game.")
             return
 
+        self.flash_timer.stop()
+        self.flashing.clear()
+        self.color_codes = {}
+        self.init_codes = np.array(
+            [[self.color_code(self.init_colors[i][j]) for j in range(self.size)] for i in range(self.size)],
+            dtype=np.int16)
+        self.user_codes = np.full((self.size, self.size), -1, dtype=np.int16)
+
+        if len(self.cells) == self.size:
+            # Same grid as last game: recolor the existing cells in place
+            for i in range(self.size):
+                for j in range(self.size):
+                    self.cells[i][j].reset(self.init_colors[i][j], self.colors)
+            self.relayout_cells()
+            return
+
         self.scene.clear()
         self.cells = [[None for _ in range(self.size)] for _ in range(self.size)]
-        self.user_grid = [[None for _ in range(self.size)] for _ in range(self.size)]
+        cell_size = self.grid_geometry()[0]
+        for i in range(self.size):
+            for j in range(self.size):
+                color_name = self.init_colors[i][j] if self.init_colors else "white"
+                
+                # Pass self.colors (all available colors for context menu)
+                cell = ColorCell(color_name, self.colors, self, i, j, cell_size)
+                self.scene.addItem(cell)
+                self.cells[i][j] = cell
 
+        self.place_cells()
+
+    def grid_geometry(self):
         view_width = self.view.viewport().width()
         view_height = self.view.viewport().height()
-        
+
         # Calculate available space for the grid, considering the smaller dimension
         available_size = min(view_width, view_height)
-        
+
         spacing = 10 # Spacing between cells
-        
-        # Calculate total size needed for all cells and their spacing
-        total_grid_dimension = self.size * (self.cell_size + spacing) - spacing
-        
-        # Dynamically calculate cell_size based on view size and number of cells
-        # Ensure there's space for spacing
-        
-        # Calculate cell_size to fit within the view, with spacing
-        # available_size = self.size * cell_size + (self.size - 1) * spacing
-        # cell_size = (available_size - (self.size - 1) * spacing) / self.size
-        # The above logic is better if you want exact fit. The code snippet had it slightly differently.
-        # Let's use the snippet's logic for now, adjusting for the calculated available_size.
 
         # Recalculate cell_size to fit all cells and spacing within available_size
-        self.cell_size = (available_size - (self.size + 1) * spacing) / self.size # Original logic was (available_size - total_spacing) / self.size, total_spacing is (self.size + 1) * spacing
-        if self.cell_size <= 0: # Prevent negative or zero cell size
-            self.cell_size = 50 # Default minimum size
+        cell_size = (available_size - (self.size + 1) * spacing) / self.size
+        if cell_size <= 0: # Prevent negative or zero cell size
+            cell_size = 50 # Default minimum size
 
-        total_grid_width = self.size * (self.cell_size + spacing)
-        total_grid_height = self.size * (self.cell_size + spacing)
+        total_grid_width = self.size * (cell_size + spacing)
+        total_grid_height = self.size * (cell_size + spacing)
 
         # Center the grid in the view
-        x_offset = (view_width - total_grid_width) / 2 + self.cell_size / 2
-        y_offset = (view_height - total_grid_height) / 2 + self.cell_size / 2
-
+        x_offset = (view_width - total_grid_width) / 2 + cell_size / 2
+        y_offset = (view_height - total_grid_height) / 2 + cell_size / 2
+        return cell_size, spacing, x_offset, y_offset
 
+    def place_cells(self):
+        # Resize and move the existing cells to fit the current view
+        cell_size, spacing, x_offset, y_offset = self.grid_geometry()
+        self.cell_size = cell_size
         for i in range(self.size):
             for j in range(self.size):
-                color_name = self.init_colors[i][j] if self.init_colors else "white"
-                
-                # Pass self.colors (all available colors for context menu)
-                cell = ColorCell(color_name, self.colors, self, i, j, self.cell_size)
-                
+                cell = self.cells[i][j]
+                cell.set_cell_size(cell_size)
+
                 # Calculate position based on cell's center being at the grid point
-                x = j * (self.cell_size + spacing) + x_offset
-                y = i * (self.cell_size + spacing) + y_offset
+                x = j * (cell_size + spacing) + x_offset
+                y = i * (cell_size + spacing) + y_offset
                 cell.setPos(x, y)
-                
-                self.scene.addItem(cell)
-                self.cells[i][j] = cell
-                self.user_grid[i][j] = None # Reset user's choice for new game
 
+        view_width = self.view.viewport().width()
+        view_height = self.view.viewport().height()
         self.scene.setSceneRect(0, 0, view_width, view_height) # Set scene rect to match view
+        self.placed_geometry = (view_width, view_height, self.size)
+
+    def color_code(self, color_name):
+        return self.color_codes.setdefault(color_name, len(self.color_codes))
 
     def update_cell(self, i, j, selected_color_name):
-        self.user_grid[i][j] = selected_color_name
+        self.user_codes[i, j] = self.color_code(selected_color_name)
         # Here you might want to call check_csp automatically or enable the button
 
     def clear_grid(self):
+        # Stop every flash at once, then reset all cells behind a single repaint
+        self.flash_timer.stop()
+        self.flashing.clear()
+        self.view.setUpdatesEnabled(False)
         for i in range(self.size):
             for j in range(self.size):
                 cell = self.cells[i][j]
                 cell.selected_color_name = None
-                cell.display_color = cell.get_color_rgb(cell.original_color_name)
-                cell.stop_flash() # Stop any flashing
-                cell.update()
-                self.user_grid[i][j] = None
+                cell.set_label(None)
+                cell.set_display_color(cell.default_color)
+        self.view.setUpdatesEnabled(True)
+        self.user_codes.fill(-1)
         self.status_label.setText("Grid cleared. Click cells to select colors.")
         self.check_btn.setEnabled(True) # Re-enable check button
 
@@ -426,19 +502,17 @@ class ColorMatchingWindow(QMainWindow):
         self.show_admin_dialog() # This will generate a new game upon dialog acceptance
 
     def check_csp(self):
-        consistent = True
-        score = 0
-        for i in range(self.size):
-            for j in range(self.size):
-                cell = self.cells[i][j]
-                correct_color = self.init_colors[i][j] # The original correct color
-                
-                if self.user_grid[i][j] == correct_color:
-                    score += 1
-                else:
-                    consistent = False
-                
-                cell.evaluate_match(correct_color) # This will handle flashing/displaying original color
+        # Score the whole grid in one array comparison
+        matches = self.user_codes == self.init_codes
+        score = int(matches.sum())
+        consistent = bool(matches.all())
+        # Only mismatched cells flash; matched ones just show their original color
+        for i, j in np.argwhere(~matches):
+            self.cells[i][j].start_flash()
+        for i, j in np.argwhere(matches):
+            cell = self.cells[i][j]
+            cell.stop_flash()
+            cell.set_display_color(cell.default_color)
 
         result_dialog = QDialog(self)
         result_dialog.setWindowTitle("CSP Matching Result")
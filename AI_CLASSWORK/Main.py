@@ -1,12 +1,137 @@
 import sys
 from PyQt6.QtWidgets import (
-    QApplication, QWidget, QPushButton, QGridLayout, QLabel, QVBoxLayout, QHBoxLayout
+    QApplication, QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout,
+    QGraphicsView, QGraphicsScene, QGraphicsRectItem
 )
-from PyQt6.QtGui import QFont
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont, QBrush, QColor, QPen
+from PyQt6.QtCore import Qt, QTimer
 from collections import deque
+from array import array
+import heapq
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional, the search kernel also runs as plain Python
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
 
 ROWS, COLS = 10, 10
+CELL_SIZE = 40
+
+# Brush for each cell state, built once; changing a cell is just a brush swap
+CELL_BRUSHES = {
+    value: QBrush(QColor(color))
+    for value, color in {
+        'empty': 'white',
+        'start': 'green',
+        'goal': 'red',
+        'wall': 'black',
+        'visited': 'lightblue',
+        'path': 'yellow'
+    }.items()
+}
+GRID_PEN = QPen(QColor('gray'))
+PAINT_BATCH = 25  # Cells painted per animation frame
+
+# Frontier policies for search_kernel
+BFS, DFS, UCS, DLS = 0, 1, 2, 3
+DEPTH_LIMIT = ROWS + COLS  # How deep the DLS button searches
+UNREACHED = np.iinfo(np.int32).max
+
+# Bit k of a cell's neighbor bits is set when NEIGHBOR_MOVES[k] stays on the
+# grid; NEIGHBOR_OFFSETS turns each bit value into its flat-index step
+NEIGHBOR_MOVES = ((-1, 0), (1, 0), (0, -1), (0, 1))
+NEIGHBOR_OFFSETS = (0, -COLS, COLS, 0, -1, 0, 0, 0, 1)
+
+
+@njit(cache=True, nogil=True)
+def search_kernel(walls, neighbor_bits, start, goal, algo, limit, best, prev, order, cells, depths, parents):
+    """
+    One search over the flat wall grid from index start to goal, for every
+    button. algo picks the frontier: a queue for BFS, a stack for
+    DFS and DLS (which stops expanding at depth limit) and a priority queue
+    for UCS. best must come in filled with UNREACHED and prev with -1.
+    cells, depths and parents hold the frontier and need 4 * rows * cols + 1
+    slots. Each cell's moves come from its neighbor_bits. Fills prev with
+    each expanded cell's parent and order with cells in the order they were
+    first expanded. Returns (found, cells in order).
+    Compiled without the GIL, so a search can also run off the GUI thread.
+    """
+    heap = [(np.int64(0), np.int64(start), np.int64(-1))]
+    cells[0], depths[0], parents[0] = start, 0, -1
+    head, tail = 0, 1
+    count = 0
+    while True:
+        if algo == UCS:
+            if not heap:
+                break
+            d, idx, parent = heapq.heappop(heap)
+        elif algo == BFS:
+            if head == tail:
+                break
+            d, idx, parent = np.int64(depths[head]), np.int64(cells[head]), np.int64(parents[head])
+            head += 1
+        else:
+            if tail == 0:
+                break
+            tail -= 1
+            d, idx, parent = np.int64(depths[tail]), np.int64(cells[tail]), np.int64(parents[tail])
+
+        # Skip cells already expanded at this depth or less; DFS expands
+        # each cell only once
+        if best[idx] <= d or (algo == DFS and best[idx] != UNREACHED):
+            continue
+        if best[idx] == UNREACHED:
+            order[count] = idx
+            count += 1
+        best[idx] = d
+        prev[idx] = parent
+        if idx == goal:
+            return True, count
+        if algo == DLS and d == limit:
+            continue
+
+        # Walk the set bits instead of bounds-checking all four moves
+        mask = int(neighbor_bits[idx])
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            nidx = idx + NEIGHBOR_OFFSETS[bit]
+            if not walls[nidx]:
+                if best[nidx] > d + 1 and (algo != DFS or best[nidx] == UNREACHED):
+                    if algo == UCS:
+                        heapq.heappush(heap, (d + 1, np.int64(nidx), idx))
+                    else:
+                        cells[tail] = nidx
+                        depths[tail] = d + 1
+                        parents[tail] = idx
+                        tail += 1
+    return False, count
+
+
+if HAVE_NUMBA:
+    # Compile once at import so the first solve doesn't wait for the JIT
+    search_kernel(np.zeros(1, dtype=np.uint8), np.zeros(1, dtype=np.uint8), 0, 0, BFS, 0,
+                  np.full(1, UNREACHED, dtype=np.int32), np.full(1, -1, dtype=np.int32),
+                  np.empty(1, dtype=np.int32), np.empty(5, dtype=np.int32),
+                  np.empty(5, dtype=np.int32), np.empty(5, dtype=np.int32))
+
+
+class CustomGraphicsView(QGraphicsView):
+    def __init__(self, scene, parent=None):
+        super().__init__(scene, parent)
+        self.maze_solver = None
+
+    def mousePressEvent(self, event):
+        # Clicks are mapped to a cell by the MazeSolver
+        if self.maze_solver:
+            self.maze_solver.handle_view_mouse_press(event)
+        super().mousePressEvent(event)
+
 
 class MazeSolver(QWidget):
     def __init__(self):
@@ -14,8 +139,27 @@ class MazeSolver(QWidget):
         self.setWindowTitle("Maze Solver (BFS, DFS, UCS, DLS, IDDFS)")
         self.resize(500, 450)
 
-        self.buttons = []
+        self.rects = []
         self.state = [['empty' for _ in range(COLS)] for _ in range(ROWS)]
+        self.wall_mask = bytearray(ROWS * COLS)  # 1 at r * COLS + c when that cell is a wall
+        # The same bytes seen as an array for the search kernel
+        self.wall_array = np.frombuffer(self.wall_mask, dtype=np.uint8)
+
+        # Search scratch buffers, allocated once and reset in place per solve
+        self.best = np.full(ROWS * COLS, UNREACHED, dtype=np.int32)
+        self.prev = np.full(ROWS * COLS, -1, dtype=np.int32)
+        self.order = np.empty(ROWS * COLS, dtype=np.int32)
+        self.frontier_cells = np.empty(4 * ROWS * COLS + 1, dtype=np.int32)
+        self.frontier_depths = np.empty(4 * ROWS * COLS + 1, dtype=np.int32)
+        self.frontier_parents = np.empty(4 * ROWS * COLS + 1, dtype=np.int32)
+        self.search_cache = {}  # (algorithm, start, goal, walls) -> (visited order, path)
+        self.dirty_cells = set()  # (row, col) of cells that may not be 'empty'
+
+        # Searches finish at once; their results are played back from this
+        # queue of (row, col, value) by a frame timer
+        self.anim_queue = deque()
+        self.anim_timer = QTimer(self)
+        self.anim_timer.timeout.connect(self.tick_animation)
         self.start_pos = None
         self.goal_pos = None
         self.setting_mode = 'start'
@@ -25,12 +169,19 @@ class MazeSolver(QWidget):
         self.build_grid()
 
     def create_widgets(self):
-        self.grid_layout = QGridLayout()
+        self.scene = QGraphicsScene()
+        self.view = CustomGraphicsView(self.scene)
+        self.view.maze_solver = self
+        self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        frame = 2 * self.view.frameWidth()
+        self.view.setFixedSize(COLS * CELL_SIZE + frame, ROWS * CELL_SIZE + frame)
         self.info_label = QLabel("Click to set Start, Goal, and Walls")
         self.info_label.setFont(QFont("Arial", 14))
 
         # Create solve buttons
         self.bfs_btn = QPushButton("Solve with BFS")
+        self.bibfs_btn = QPushButton("Solve with Bi-BFS")
         self.dfs_btn = QPushButton("Solve with DFS")
         self.ucs_btn = QPushButton("Solve with UCS")
         self.dls_btn = QPushButton("Solve with DLS")
@@ -39,6 +190,7 @@ class MazeSolver(QWidget):
 
         # Connect button signals
         self.bfs_btn.clicked.connect(self.solve_bfs)
+        self.bibfs_btn.clicked.connect(self.solve_bibfs)
         self.dfs_btn.clicked.connect(self.solve_dfs)
         self.ucs_btn.clicked.connect(self.solve_ucs)
         self.dls_btn.clicked.connect(self.solve_dls)
@@ -52,12 +204,13 @@ class MazeSolver(QWidget):
         # Add info label
         main_layout.addWidget(self.info_label)
 
-        # Add grid layout
-        main_layout.addLayout(self.grid_layout)
+        # Add the maze view
+        main_layout.addWidget(self.view, alignment=Qt.AlignmentFlag.AlignHCenter)
 
         # Create a horizontal layout for solve buttons
         solve_buttons_layout = QHBoxLayout()
         solve_buttons_layout.addWidget(self.bfs_btn)
+        solve_buttons_layout.addWidget(self.bibfs_btn)
         solve_buttons_layout.addWidget(self.dfs_btn)
         solve_buttons_layout.addWidget(self.ucs_btn)
         solve_buttons_layout.addWidget(self.dls_btn)
@@ -72,17 +225,40 @@ class MazeSolver(QWidget):
 
     def build_grid(self):
         for row in range(ROWS):
-            row_buttons = []
+            row_rects = []
             for col in range(COLS):
-                btn = QPushButton("")
-                btn.setFixedSize(40, 40)  # Adjust cell size
-                btn.setStyleSheet("background-color: white; border: 1px solid gray;")
-                btn.clicked.connect(lambda _, r=row, c=col: self.cell_clicked(r, c))
-                self.grid_layout.addWidget(btn, row, col)
-                row_buttons.append(btn)
-            self.buttons.append(row_buttons)
+                rect = QGraphicsRectItem(col * CELL_SIZE, row * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+                rect.setBrush(CELL_BRUSHES['empty'])
+                rect.setPen(GRID_PEN)
+                self.scene.addItem(rect)
+                row_rects.append(rect)
+            self.rects.append(row_rects)
+        self.scene.setSceneRect(0, 0, COLS * CELL_SIZE, ROWS * CELL_SIZE)
+
+        # In-bounds neighbors of every flat cell index, so searches skip the
+        # bounds checks and offset list on each pop
+        self.neighbors = [
+            tuple((row + dr) * COLS + col + dc for dr, dc in [(-1,0), (1,0), (0,-1), (0,1)]
+                  if 0 <= row + dr < ROWS and 0 <= col + dc < COLS)
+            for row in range(ROWS) for col in range(COLS)
+        ]
+        self.neighbor_bits = np.array([
+            sum(1 << k for k, (dr, dc) in enumerate(NEIGHBOR_MOVES)
+                if 0 <= row + dr < ROWS and 0 <= col + dc < COLS)
+            for row in range(ROWS) for col in range(COLS)
+        ], dtype=np.uint8)
+
+    def handle_view_mouse_press(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            pos = self.view.mapToScene(event.pos())
+            row = int(pos.y() // CELL_SIZE)
+            col = int(pos.x() // CELL_SIZE)
+            if 0 <= row < ROWS and 0 <= col < COLS:
+                self.cell_clicked(row, col)
 
     def cell_clicked(self, row, col):
+        self.finish_animation()
+        self.search_cache.clear()
         if self.setting_mode == 'start':
             if self.start_pos:
                 self.update_cell(*self.start_pos, 'empty')
@@ -107,81 +283,169 @@ class MazeSolver(QWidget):
 
     def update_cell(self, row, col, value):
         self.state[row][col] = value
-        color_map = {
-            'empty': 'white',
-            'start': 'green',
-            'goal': 'red',
-            'wall': 'black',
-            'visited': 'lightblue',
-            'path': 'yellow'
-        }
-        self.buttons[row][col].setStyleSheet(f"background-color: {color_map[value]}; border: 1px solid gray;")
+        if value != 'empty':
+            self.dirty_cells.add((row, col))
+        self.wall_mask[row * COLS + col] = value == 'wall'
+        self.rects[row][col].setBrush(CELL_BRUSHES[value])
+
+    def paint_cells(self, cells, value):
+        self.anim_queue.extend((row, col, value) for row, col in cells)
+        if not self.anim_timer.isActive():
+            self.anim_timer.start(16)
+
+    def tick_animation(self):
+        for _ in range(min(PAINT_BATCH, len(self.anim_queue))):
+            self.update_cell(*self.anim_queue.popleft())
+        if not self.anim_queue:
+            self.anim_timer.stop()
+
+    def finish_animation(self):
+        # Paint whatever is still queued so the grid matches the state again
+        while self.anim_queue:
+            self.update_cell(*self.anim_queue.popleft())
+        self.anim_timer.stop()
 
     def solve_bfs(self):
+        self.solve_with("BFS", lambda: self.run_search(BFS))
+
+    def solve_bibfs(self):
+        self.solve_with("bidirectional BFS", self.bibfs_search)
+
+    def solve_with(self, name, search):
         if not self.start_pos or not self.goal_pos:
             self.info_label.setText("Start and Goal must be set!")
             return
 
-        print("Solving with BFS...")
-        visited = [[False for _ in range(COLS)] for _ in range(ROWS)]
-        prev = [[None for _ in range(COLS)] for _ in range(ROWS)]
-
-        q = deque()
-        q.append(self.start_pos)
-        visited[self.start_pos[0]][self.start_pos[1]] = True
-
-        found = False
-
-        while q:
-            row, col = q.popleft()
-            if (row, col) != self.start_pos and (row, col) != self.goal_pos:
-                self.update_cell(row, col, 'visited')
-                QApplication.processEvents()
-
-            if (row, col) == self.goal_pos:
-                found = True
-                break
-
-            for dr, dc in [(-1,0), (1,0), (0,-1), (0,1)]:
-                r, c = row + dr, col + dc
-                if 0 <= r < ROWS and 0 <= c < COLS and not visited[r][c] and self.state[r][c] != 'wall':
-                    q.append((r, c))
-                    visited[r][c] = True
-                    prev[r][c] = (row, col)
-
-        if found:
-            self.reconstruct_path(prev)
+        print(f"Solving with {name}...")
+        self.finish_animation()
+        # Same maze, same answer: a repeat solve only replays the painting
+        key = (name, self.start_pos, self.goal_pos, bytes(self.wall_mask))
+        if key not in self.search_cache:
+            self.search_cache[key] = search()
+        visited_order, path = self.search_cache[key]
+
+        self.paint_cells(visited_order, 'visited')
+        if path is not None:
+            self.paint_cells(path, 'path')
             self.info_label.setText("Path found!")
         else:
             self.info_label.setText("No path found!")
 
+    def run_search(self, algo, limit=0):
+        # Returns the (row, col) cells in the order the search expanded them
+        # and the path between start and goal, or None for the path if there
+        # is none
+        self.best.fill(UNREACHED)
+        self.prev.fill(-1)
+        start = self.start_pos[0] * COLS + self.start_pos[1]
+        goal = self.goal_pos[0] * COLS + self.goal_pos[1]
+
+        found, count = search_kernel(
+            self.wall_array, self.neighbor_bits, start, goal, algo, limit, self.best, self.prev, self.order,
+            self.frontier_cells, self.frontier_depths, self.frontier_parents)
+        # Everything expanded except the start, and the goal when it was reached
+        end = count - 1 if found else count
+        visited_order = [divmod(idx, COLS) for idx in self.order[1:end].tolist()]
+        return visited_order, self.reconstruct_path(self.prev) if found else None
+
+    def iddfs_search(self):
+        # Deepen the DLS limit until the goal is found, or until one more
+        # level reaches no new cells
+        reached = -1
+        for limit in range(ROWS * COLS):
+            visited_order, path = self.run_search(DLS, limit)
+            if path is not None or len(visited_order) == reached:
+                break
+            reached = len(visited_order)
+        return visited_order, path
+
     def reconstruct_path(self, prev):
-        row, col = self.goal_pos
-        while (row, col) != self.start_pos:
-            row, col = prev[row][col]
-            if (row, col) != self.start_pos:
-                self.update_cell(row, col, 'path')
-                QApplication.processEvents()
+        path = []
+        start = self.start_pos[0] * COLS + self.start_pos[1]
+        idx = int(prev[self.goal_pos[0] * COLS + self.goal_pos[1]])
+        while idx != start and idx != -1:
+            path.append(divmod(idx, COLS))
+            idx = int(prev[idx])
+        return path
+
+    def bibfs_search(self):
+        start = self.start_pos[0] * COLS + self.start_pos[1]
+        goal = self.goal_pos[0] * COLS + self.goal_pos[1]
+        visited_f = bytearray(ROWS * COLS)
+        visited_b = bytearray(ROWS * COLS)
+        prev_f = array('i', [-1]) * (ROWS * COLS)
+        prev_b = array('i', [-1]) * (ROWS * COLS)
+        visited_f[start] = 1
+        visited_b[goal] = 1
+        qf = deque([start])
+        qb = deque([goal])
+        visited_order = []
+
+        # Search from both ends, always growing the smaller frontier by one
+        # whole level, until the two searches touch
+        meet = start if start == goal else -1
+        while meet == -1 and qf and qb:
+            if len(qf) <= len(qb):
+                meet = self.expand_level(qf, visited_f, prev_f, visited_b, visited_order)
+            else:
+                meet = self.expand_level(qb, visited_b, prev_b, visited_f, visited_order)
+
+        if meet == -1:
+            return visited_order, None
+
+        # Start to the meeting cell through prev_f, then on to the goal through prev_b
+        path = []
+        idx = meet
+        while idx != -1:
+            path.append(idx)
+            idx = prev_f[idx]
+        path.reverse()
+        idx = prev_b[meet]
+        while idx != -1:
+            path.append(idx)
+            idx = prev_b[idx]
+        return visited_order, [divmod(idx, COLS) for idx in path[1:-1]]
+
+    def expand_level(self, queue, visited, prev, other_visited, visited_order):
+        # Expand every cell currently queued; return the first cell the other
+        # search has already reached, or -1
+        wall_mask = self.wall_mask
+        neighbors = self.neighbors
+        for _ in range(len(queue)):
+            idx = queue.popleft()
+            for nidx in neighbors[idx]:
+                if not visited[nidx] and not wall_mask[nidx]:
+                    visited[nidx] = 1
+                    prev[nidx] = idx
+                    if other_visited[nidx]:
+                        return nidx
+                    queue.append(nidx)
+                    visited_order.append(divmod(nidx, COLS))
+        return -1
 
     def solve_dfs(self):
-        self.info_label.setText("DFS not yet implemented.")
+        self.solve_with("DFS", lambda: self.run_search(DFS))
 
     def solve_ucs(self):
-        self.info_label.setText("UCS not yet implemented.")
+        self.solve_with("UCS", lambda: self.run_search(UCS))
 
     def solve_dls(self):
-        self.info_label.setText("DLS not yet implemented.")
+        self.solve_with("DLS", lambda: self.run_search(DLS, DEPTH_LIMIT))
 
     def solve_iddfs(self):
-        self.info_label.setText("IDDFS not yet implemented.")
+        self.solve_with("IDDFS", self.iddfs_search)
 
     def clear_grid(self):
-        for row in range(ROWS):
-            for col in range(COLS):
-                self.update_cell(row, col, 'empty')
+        self.anim_queue.clear()
+        self.anim_timer.stop()
+        # Only cells that were ever given a non-empty state need resetting
+        for row, col in self.dirty_cells:
+            self.update_cell(row, col, 'empty')
+        self.dirty_cells.clear()
         self.start_pos = None
         self.goal_pos = None
         self.setting_mode = 'start'
+        self.search_cache.clear()
         self.info_label.setText("Click to set Start, Goal, and Walls")
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 import sys
+import functools
 import sqlite3
 import re
 from datetime import datetime
@@ -6,24 +7,32 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout
                              QWidget, QPushButton, QTextEdit, QLabel, QListWidget,
                              QSplitter, QMessageBox, QProgressBar, QLineEdit, QDialog,
                              QDialogButtonBox, QListWidgetItem)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSize
+from PyQt6.QtCore import Qt, QThread, QThreadPool, QRunnable, QObject, pyqtSignal, QSize
 from PyQt6.QtGui import QFont, QIcon
 import nltk
+import numpy as np
+import spacy
+from nltk.corpus import stopwords
+from nltk.stem import PorterStemmer
 import qtawesome as qta  # --- NEW: Import qtawesome for icons ---
 
-# --- All your backend classes (TextSummarizer, SummarizationWorker, DatabaseManager) remain unchanged ---
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional, the scoring kernel also runs as plain Python
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# --- All your backend classes (TextSummarizer, SummarizationTask, DatabaseManager) remain unchanged ---
 # --- I'm collapsing them here for brevity, but they are still part of the full script. ---
 
 #<editor-fold desc="Backend Classes (Unchanged)">
 # Download required NLTK data (run once)
 def download_nltk_data():
     """Download required NLTK data with proper error handling"""
-    try:
-        nltk.data.find('tokenizers/punkt')
-    except LookupError:
-        print("Downloading NLTK punkt tokenizer...")
-        nltk.download('punkt', quiet=True)
-
     try:
         nltk.data.find('corpora/stopwords')
     except LookupError:
@@ -33,149 +42,203 @@ def download_nltk_data():
 # Ensure NLTK data is available
 download_nltk_data()
 
+# Blank English pipeline with only a rule-based sentencizer; loaded once and
+# shared, so summarize() tokenizes the article in a single pass
+NLP = spacy.blank("en")
+NLP.add_pipe("sentencizer")
+
+@njit(parallel=True, fastmath=True, cache=True)
+def score_sentences(freq_lookup, keyword_lookup, indices, indptr):
+    # Mean word frequency and keyword presence of every sentence, where
+    # sentence i owns indices[indptr[i]:indptr[i + 1]]. freq_lookup holds the
+    # frequencies as uint8 fixed point (255 == 1.0).
+    n = len(indptr) - 1
+    scores = np.zeros(n)
+    has_keyword = np.zeros(n, dtype=np.bool_)
+    for i in prange(n):
+        start, end = indptr[i], indptr[i + 1]
+        total = np.uint32(0)
+        for k in range(start, end):
+            total += freq_lookup[indices[k]]
+            if keyword_lookup[indices[k]]:
+                has_keyword[i] = True
+        if end > start:
+            scores[i] = total / ((end - start) * 255.0)
+    return scores, has_keyword
+
+if HAVE_NUMBA:
+    # Compile once at import so the first summary doesn't wait for the JIT
+    score_sentences(np.zeros(1, dtype=np.uint8), np.zeros(1, dtype=np.bool_),
+                    np.zeros(1, dtype=np.int32), np.array([0, 1], dtype=np.int32))
+
 class TextSummarizer:
     """Local AI model for text summarization using extractive approach"""
+    try:
+        STOP_WORDS = frozenset(stopwords.words('english'))
+    except LookupError:
+        nltk.download('stopwords', quiet=True)
+        STOP_WORDS = frozenset(stopwords.words('english'))
+    # Keywords that often mark important content, matched against sentence tokens
+    IMPORTANT_KEYWORDS = frozenset({'significant', 'important', 'contributes', 'produces', 'economic', 'cultural', 'traditional', 'ecological', 'benefits'})
+    # Sentences per summary slot that get fully scored on long articles
+    SHORTLIST_FACTOR = 3
+    WHITESPACE_RE = re.compile(r'\s+')
+    # Importance flags: any number, and any capitalised word of 3+ letters
+    DIGIT_RE = re.compile(r'\d')
+    CAPITAL_WORD_RE = re.compile(r'\b[A-Z][A-Za-z]{2,}')
+
     def __init__(self):
-        from nltk.corpus import stopwords
-        from nltk.stem import PorterStemmer
         self.stemmer = PorterStemmer()
-        try:
-            self.stop_words = set(stopwords.words('english'))
-        except LookupError:
-            nltk.download('stopwords', quiet=True)
-            self.stop_words = set(stopwords.words('english'))
-
-    def simple_sentence_split(self, text):
-        import re
-        sentences = re.split(r'[.!?]+', text)
-        return [s.strip() for s in sentences if s.strip()]
-
-    def simple_word_tokenize(self, text):
-        import re
-        return re.findall(r'\b[a-zA-Z]+\b', text.lower())
 
     def preprocess_text(self, text):
-        return re.sub(r'\s+', ' ', text.strip())
-
-    def calculate_sentence_scores(self, sentences, word_freq):
-        from nltk.tokenize import word_tokenize
-        sentence_scores = {}
-        for i, sentence in enumerate(sentences):
-            try:
-                words = word_tokenize(sentence.lower())
-            except (LookupError, OSError):
-                words = self.simple_word_tokenize(sentence)
-            words = [word for word in words if word.isalnum() and word not in self.stop_words]
-            if len(words) > 0:
-                score = sum(word_freq.get(word, 0) for word in words) / len(words)
-                position_boost = 1.3 if i == 0 else 1.2 if i == len(sentences) - 1 else 1.1 if i < len(sentences) * 0.3 else 1.0
-                length_boost = min(1.5, len(words) / 15.0) if len(words) > 10 else 0.8
-                importance_boost = 1.0
-                if any(char.isdigit() for char in sentence): importance_boost += 0.2
-                if any(word[0].isupper() for word in sentence.split() if len(word) > 2): importance_boost += 0.1
-                important_keywords = ['significant', 'important', 'contributes', 'produces', 'economic', 'cultural', 'traditional', 'ecological', 'benefits']
-                if any(keyword in sentence.lower() for keyword in important_keywords): importance_boost += 0.15
-                final_score = score * position_boost * length_boost * importance_boost
-                sentence_scores[sentence] = final_score
-        return sentence_scores
+        return self.WHITESPACE_RE.sub(' ', text.strip())
+
+    def calculate_sentence_scores(self, sents, word_freq, shortlist=None):
+        # sents are the spaCy sentence spans, so their tokens are reused as-is.
+        # They are flattened into vocabulary indices CSR-style (sentence i owns
+        # indices[indptr[i]:indptr[i + 1]]) so every score and boost below is
+        # computed for all sentences at once.
+        vocab = {word: k for k, word in enumerate(word_freq)}
+        # Quantized to a byte per word so the lookup table stays cache-resident
+        freq_lookup = np.rint(np.fromiter(word_freq.values(), dtype=np.float32, count=len(word_freq)) * 255).astype(np.uint8)
+        keyword_lookup = np.fromiter((word in self.IMPORTANT_KEYWORDS for word in word_freq), dtype=bool, count=len(word_freq))
+        indices, indptr = [], [0]
+        for sent in sents:
+            indices.extend(vocab[token.lower_] for token in sent if token.is_alpha and token.lower_ not in self.STOP_WORDS)
+            indptr.append(len(indices))
+        indptr = np.array(indptr, dtype=np.int32)
+        score, has_keyword = score_sentences(freq_lookup, keyword_lookup, np.array(indices, dtype=np.int32), indptr)
+        counts = np.diff(indptr)
+        n = len(sents)
+        candidates = np.arange(n)
+        if shortlist and n > shortlist:
+            # Long article: only sentences with the best plain frequency score
+            # are boosted, the rest are dropped before the per-sentence work
+            candidates = np.sort(np.argpartition(-score, shortlist - 1)[:shortlist])
+        position_boost = np.where(candidates < n * 0.3, 1.1, 1.0)
+        position_boost[candidates == n - 1] = 1.2
+        position_boost[candidates == 0] = 1.3
+        length_boost = np.where(counts[candidates] > 10, np.minimum(1.5, counts[candidates] / 15.0), 0.8)
+        texts = [sents[i].text for i in candidates.tolist()]
+        has_digit = np.array([self.DIGIT_RE.search(text) is not None for text in texts], dtype=bool)
+        has_capital = np.array([self.CAPITAL_WORD_RE.search(text) is not None for text in texts], dtype=bool)
+        importance_boost = 1.0 + 0.2 * has_digit + 0.1 * has_capital + 0.15 * has_keyword[candidates]
+        final_score = np.full(n, -np.inf)
+        final_score[candidates] = score[candidates] * position_boost * length_boost * importance_boost
+        # Sentences without any scoring words can never be picked
+        final_score[counts == 0] = -np.inf
+        return final_score
 
     def summarize(self, text, ratio=0.4, min_sentences=2, max_sentences=8):
-        from nltk.tokenize import sent_tokenize, word_tokenize
         from collections import Counter
-        import heapq
         if not text or len(text.strip()) < 100: return "Text too short to summarize effectively."
         text = self.preprocess_text(text)
-        try:
-            sentences = sent_tokenize(text)
-        except (LookupError, OSError):
-            try: nltk.download('punkt', quiet=True); sentences = sent_tokenize(text)
-            except: sentences = self.simple_sentence_split(text)
+        doc = NLP(text)
+        sents = list(doc.sents)
+        sentences = [sent.text for sent in sents]
         if len(sentences) < 3: return text
-        try:
-            words = word_tokenize(text.lower())
-        except (LookupError, OSError):
-            try: nltk.download('punkt', quiet=True); words = word_tokenize(text.lower())
-            except: words = self.simple_word_tokenize(text)
-        words = [word for word in words if word.isalnum() and word not in self.stop_words]
+        words = [token.lower_ for token in doc if token.is_alpha and token.lower_ not in self.STOP_WORDS]
         word_freq = Counter(words)
         if not word_freq: return "Could not find significant words to summarize."
-        max_freq = max(word_freq.values())
-        word_freq = {word: freq / max_freq for word, freq in word_freq.items()}
-        sentence_scores = self.calculate_sentence_scores(sentences, word_freq)
+        # Normalize all counts in one NumPy pass instead of a dict comprehension
+        freqs = np.fromiter(word_freq.values(), dtype=np.float32, count=len(word_freq))
+        freqs /= freqs.max()
+        word_freq = dict(zip(word_freq, freqs.tolist()))
+        sentence_scores = self.calculate_sentence_scores(sents, word_freq, self.SHORTLIST_FACTOR * max_sentences)
         num_sentences = max(min_sentences, min(max_sentences, int(len(sentences) * ratio)))
-        top_sentences = heapq.nlargest(num_sentences, sentence_scores, key=sentence_scores.get)
-        summary_sentences = [sentence for sentence in sentences if sentence in top_sentences]
-        return ' '.join(summary_sentences)
+        num_sentences = min(num_sentences, int(np.isfinite(sentence_scores).sum()))
+        # Pick the top scores in O(N), then put them back in reading order
+        top = np.sort(np.argpartition(-sentence_scores, num_sentences - 1)[:num_sentences])
+        return ' '.join(sentences[i] for i in top.tolist())
 
-class SummarizationWorker(QThread):
+# One summarizer shared by every worker, so a click doesn't rebuild it
+SUMMARIZER = TextSummarizer()
+
+class SummarizationSignals(QObject):
     finished = pyqtSignal(str)
     error = pyqtSignal(str)
+
+class SummarizationTask(QRunnable):
+    # Runs on the shared thread pool instead of spawning a thread per click
     def __init__(self, text, ratio=0.3):
         super().__init__()
         self.text = text
         self.ratio = ratio
-        self.summarizer = TextSummarizer()
+        self.summarizer = SUMMARIZER
+        self.signals = SummarizationSignals()
 
     def run(self):
         try:
             summary = self.summarizer.summarize(self.text, self.ratio)
-            self.finished.emit(summary)
+            self.signals.finished.emit(summary)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
+
+class SummaryLoader(QThread):
+    # Fetches a saved summary's texts off the GUI thread
+    loaded = pyqtSignal(int, str, str)
+    def __init__(self, db_manager, summary_id):
+        super().__init__()
+        self.db_manager = db_manager
+        self.summary_id = summary_id
+
+    def run(self):
+        bodies = self.db_manager.get_summary_bodies(self.summary_id)
+        if bodies:
+            self.loaded.emit(self.summary_id, *bodies)
 
 class DatabaseManager:
+    INSERT_SQL = 'INSERT INTO summaries (title, original_text, summary_text, word_count_original, word_count_summary) VALUES (?, ?, ?, ?, ?)'
+
     def __init__(self, db_name="article_summaries.db"):
         self.db_name = db_name
+        # One connection for the app's lifetime instead of one per call
+        self.conn = sqlite3.connect(db_name, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA temp_store=MEMORY')
         self.init_database()
 
     def init_database(self):
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS summaries (
-                id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL,
-                original_text TEXT NOT NULL, summary_text TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                word_count_original INTEGER, word_count_summary INTEGER)''')
-        conn.commit()
-        conn.close()
-
-    def save_summary(self, title, original_text, summary_text):
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        word_count_original = len(original_text.split())
-        word_count_summary = len(summary_text.split())
-        cursor.execute('INSERT INTO summaries (title, original_text, summary_text, word_count_original, word_count_summary) VALUES (?, ?, ?, ?, ?)',
-                       (title, original_text, summary_text, word_count_original, word_count_summary))
-        conn.commit()
-        last_id = cursor.lastrowid
-        conn.close()
-        return last_id
+        with self.conn:
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS summaries (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL,
+                    original_text TEXT NOT NULL, summary_text TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    word_count_original INTEGER, word_count_summary INTEGER)''')
+            # Lets get_all_summaries read rows in order instead of sorting them
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_created ON summaries(created_at DESC)')
+
+    def save_summary(self, title, original_text, summary_text, word_count_original, word_count_summary):
+        with self.conn:
+            cursor = self.conn.execute(self.INSERT_SQL, (title, original_text, summary_text, word_count_original, word_count_summary))
+        # The new row in get_all_summaries' shape, so callers can show it without a reload
+        return self.conn.execute('SELECT id, title, created_at, word_count_original, word_count_summary FROM summaries WHERE id = ?', (cursor.lastrowid,)).fetchone()
 
     def get_all_summaries(self):
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        cursor.execute('SELECT id, title, created_at, word_count_original, word_count_summary FROM summaries ORDER BY created_at DESC')
-        summaries = cursor.fetchall()
-        conn.close()
-        return summaries
-
-    def get_summary_by_id(self, summary_id):
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM summaries WHERE id = ?', (summary_id,))
-        summary = cursor.fetchone()
-        conn.close()
-        return summary
+        return self.conn.execute('SELECT id, title, created_at, word_count_original, word_count_summary FROM summaries ORDER BY created_at DESC').fetchall()
+
+    def get_summary_meta(self, summary_id):
+        # Just the small columns, for showing a summary before its text arrives
+        return self.conn.execute('SELECT title, created_at, word_count_original, word_count_summary FROM summaries WHERE id = ?', (summary_id,)).fetchone()
+
+    def get_summary_bodies(self, summary_id):
+        return self.conn.execute('SELECT original_text, summary_text FROM summaries WHERE id = ?', (summary_id,)).fetchone()
 
     def delete_summary(self, summary_id):
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM summaries WHERE id = ?', (summary_id,))
-        conn.commit()
-        conn.close()
+        with self.conn:
+            self.conn.execute('DELETE FROM summaries WHERE id = ?', (summary_id,))
+
+    def close(self):
+        self.conn.close()
 #</editor-fold>
 
+@functools.lru_cache(maxsize=64)
+def cached_icon(name, color):
+    # qtawesome builds a new QIcon per call; hand out one per (name, color)
+    return qta.icon(name, color=color)
+
 class ArticleSummarizerApp(QMainWindow):
     """Main application window"""
     
@@ -183,11 +246,14 @@ class ArticleSummarizerApp(QMainWindow):
         super().__init__()
         self.db_manager = DatabaseManager()
         self.current_summary_id = None
-        self.summarization_worker = None
+        self.summarization_task = None
+        self.summary_loader = None
+        self.word_counts = (0, 0)  # (original, summary) words of the last summary, reused on save
+        self.last_original = ""  # Article text as submitted, so it's only copied out of the editor once
         
         self.setWindowTitle("Article Summarizer")
         self.setGeometry(100, 100, 1200, 800)
-        self.setWindowIcon(qta.icon('fa5s.robot', color='#61afef')) # --- NEW: Set a window icon
+        self.setWindowIcon(cached_icon('fa5s.robot', '#61afef')) # --- NEW: Set a window icon
 
         self.init_ui()
         self.load_saved_summaries()
@@ -227,6 +293,7 @@ class ArticleSummarizerApp(QMainWindow):
         left_layout.addWidget(title_label)
         
         self.summary_list = QListWidget()
+        self.list_title_font = QFont("Segoe UI", 10, QFont.Weight.Bold)
         self.summary_list.itemClicked.connect(self.load_selected_summary)
         left_layout.addWidget(self.summary_list)
         
@@ -235,12 +302,12 @@ class ArticleSummarizerApp(QMainWindow):
 
         # --- NEW: Add icons to buttons ---
         self.refresh_btn = QPushButton("Refresh")
-        self.refresh_btn.setIcon(qta.icon('fa5s.sync-alt', color='white'))
+        self.refresh_btn.setIcon(cached_icon('fa5s.sync-alt', 'white'))
         self.refresh_btn.clicked.connect(self.load_saved_summaries)
         button_layout.addWidget(self.refresh_btn)
         
         self.delete_btn = QPushButton("Delete")
-        self.delete_btn.setIcon(qta.icon('fa5s.trash-alt', color='white'))
+        self.delete_btn.setIcon(cached_icon('fa5s.trash-alt', 'white'))
         self.delete_btn.clicked.connect(self.delete_selected_summary)
         button_layout.addWidget(self.delete_btn)
         
@@ -276,19 +343,19 @@ class ArticleSummarizerApp(QMainWindow):
         
         # --- NEW: Add icons to buttons and set object names for styling ---
         self.summarize_btn = QPushButton("Summarize Article")
-        self.summarize_btn.setIcon(qta.icon('fa5s.magic', color='white'))
+        self.summarize_btn.setIcon(cached_icon('fa5s.magic', 'white'))
         self.summarize_btn.setObjectName("summarizeButton")
         self.summarize_btn.clicked.connect(self.summarize_article)
         control_layout.addWidget(self.summarize_btn)
         
         self.save_btn = QPushButton("Save Summary")
-        self.save_btn.setIcon(qta.icon('fa5s.save', color='white'))
+        self.save_btn.setIcon(cached_icon('fa5s.save', 'white'))
         self.save_btn.clicked.connect(self.save_current_summary)
         self.save_btn.setEnabled(False)
         control_layout.addWidget(self.save_btn)
         
         self.clear_btn = QPushButton("Clear All")
-        self.clear_btn.setIcon(qta.icon('fa5s.broom', color='white'))
+        self.clear_btn.setIcon(cached_icon('fa5s.broom', 'white'))
         self.clear_btn.clicked.connect(self.clear_all_fields)
         control_layout.addWidget(self.clear_btn)
         
@@ -326,17 +393,19 @@ class ArticleSummarizerApp(QMainWindow):
         self.summarize_btn.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)
-        self.summarization_worker = SummarizationWorker(text, 0.4)
-        self.summarization_worker.finished.connect(self.on_summarization_finished)
-        self.summarization_worker.error.connect(self.on_summarization_error)
-        self.summarization_worker.start()
+        self.last_original = text
+        self.summarization_task = SummarizationTask(text, 0.4)
+        self.summarization_task.signals.finished.connect(self.on_summarization_finished)
+        self.summarization_task.signals.error.connect(self.on_summarization_error)
+        QThreadPool.globalInstance().start(self.summarization_task)
 
     def on_summarization_finished(self, summary):
         self.summary_text.setPlainText(summary)
         self.save_btn.setEnabled(True)
         try:
-            original_words = len(self.original_text.toPlainText().split())
+            original_words = len(self.last_original.split())
             summary_words = len(summary.split())
+            self.word_counts = (original_words, summary_words)
             reduction = ((original_words - summary_words) / original_words) * 100 if original_words > 0 else 0
             stats_text = f"Original: {original_words} words  |  Summary: {summary_words} words  |  Reduction: {reduction:.1f}%"
             self.stats_label.setText(stats_text)
@@ -352,7 +421,7 @@ class ArticleSummarizerApp(QMainWindow):
 
     def save_current_summary(self):
         title = self.title_input.text().strip()
-        original = self.original_text.toPlainText().strip()
+        original = self.last_original
         summary = self.summary_text.toPlainText().strip()
         if not title:
             title = f"Summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -360,54 +429,59 @@ class ArticleSummarizerApp(QMainWindow):
             QMessageBox.warning(self, "Warning", "Cannot save: missing original text or summary.")
             return
         try:
-            self.db_manager.save_summary(title, original, summary)
+            saved = self.db_manager.save_summary(title, original, summary, *self.word_counts)
+            # Newest first, so the new row goes on top without reloading the list
+            self.insert_summary_item(0, saved)
             QMessageBox.information(self, "Success", "Summary saved successfully!")
-            self.load_saved_summaries()
             self.save_btn.setEnabled(False)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save summary: {e}")
 
     def load_saved_summaries(self):
+        # Rebuild the whole list behind one repaint and no per-item signals
+        self.summary_list.setUpdatesEnabled(False)
+        self.summary_list.blockSignals(True)
         self.summary_list.clear()
-        summaries = self.db_manager.get_all_summaries()
-        for summary in summaries:
-            summary_id, title, created_at, orig_words, summ_words = summary
-            item = QListWidgetItem()
-            
-            # --- NEW: Custom widget for better list item display ---
-            item_widget = QWidget()
-            item_layout = QVBoxLayout(item_widget)
-            item_layout.setContentsMargins(5, 5, 5, 5)
-            item_layout.setSpacing(2)
-
-            title_label = QLabel(title)
-            title_label.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-
-            details_text = f"{created_at[:16]} | {orig_words}→{summ_words} words"
-            details_label = QLabel(details_text)
-            details_label.setObjectName("detailsLabel")
-
-            item_layout.addWidget(title_label)
-            item_layout.addWidget(details_label)
-            
-            item.setSizeHint(item_widget.sizeHint())
-            item.setData(Qt.ItemDataRole.UserRole, summary_id)
-            
-            self.summary_list.addItem(item)
-            self.summary_list.setItemWidget(item, item_widget)
+        for row, summary in enumerate(self.db_manager.get_all_summaries()):
+            self.insert_summary_item(row, summary)
+        self.summary_list.blockSignals(False)
+        self.summary_list.setUpdatesEnabled(True)
+
+    def insert_summary_item(self, row, summary):
+        summary_id, title, created_at, orig_words, summ_words = summary
+        item = QListWidgetItem()
+        
+        # --- NEW: Custom widget for better list item display ---
+        item_widget = QWidget()
+        item_layout = QVBoxLayout(item_widget)
+        item_layout.setContentsMargins(5, 5, 5, 5)
+        item_layout.setSpacing(2)
 
+        title_label = QLabel(title)
+        title_label.setFont(self.list_title_font)
+
+        details_text = f"{created_at[:16]} | {orig_words}→{summ_words} words"
+        details_label = QLabel(details_text)
+        details_label.setObjectName("detailsLabel")
+
+        item_layout.addWidget(title_label)
+        item_layout.addWidget(details_label)
+        
+        item.setSizeHint(item_widget.sizeHint())
+        item.setData(Qt.ItemDataRole.UserRole, summary_id)
+        
+        self.summary_list.insertItem(row, item)
+        self.summary_list.setItemWidget(item, item_widget)
 
     def load_selected_summary(self, item):
         summary_id = item.data(Qt.ItemDataRole.UserRole)
-        summary_data = self.db_manager.get_summary_by_id(summary_id)
-        if summary_data:
-            _, title, original, summary, _, _, _ = summary_data
+        summary_meta = self.db_manager.get_summary_meta(summary_id)
+        if summary_meta:
+            title, _, original_words, summary_words = summary_meta
             self.title_input.setText(title)
-            self.original_text.setPlainText(original)
-            self.summary_text.setPlainText(summary)
+            self.original_text.clear()
+            self.summary_text.clear()
             try:
-                original_words = len(original.split())
-                summary_words = len(summary.split())
                 reduction = ((original_words - summary_words) / original_words) * 100 if original_words > 0 else 0
                 stats_text = f"Original: {original_words} words  |  Summary: {summary_words} words  |  Reduction: {reduction:.1f}%"
                 self.stats_label.setText(stats_text)
@@ -415,6 +489,17 @@ class ArticleSummarizerApp(QMainWindow):
                 self.stats_label.setText("Could not calculate statistics.")
             self.current_summary_id = summary_id
             self.save_btn.setEnabled(False)
+            # The texts can be large, so they load in the background
+            if self.summary_loader:
+                self.summary_loader.wait()
+            self.summary_loader = SummaryLoader(self.db_manager, summary_id)
+            self.summary_loader.loaded.connect(self.on_summary_loaded)
+            self.summary_loader.start()
+
+    def on_summary_loaded(self, summary_id, original, summary):
+        if summary_id == self.current_summary_id: # Ignore a selection the user has moved away from
+            self.original_text.setPlainText(original)
+            self.summary_text.setPlainText(summary)
 
     def delete_selected_summary(self):
         current_item = self.summary_list.currentItem()
@@ -427,12 +512,19 @@ class ArticleSummarizerApp(QMainWindow):
             summary_id = current_item.data(Qt.ItemDataRole.UserRole)
             try:
                 self.db_manager.delete_summary(summary_id)
-                self.load_saved_summaries()
+                row = self.summary_list.row(current_item)
+                self.summary_list.takeItem(row)
                 self.clear_all_fields()
                 QMessageBox.information(self, "Success", "Summary deleted successfully!")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to delete summary: {e}")
 
+    def closeEvent(self, event):
+        if self.summary_loader:
+            self.summary_loader.wait()
+        self.db_manager.close()
+        super().closeEvent(event)
+
     def clear_all_fields(self):
         self.title_input.clear()
         self.original_text.clear()
@@ -440,6 +532,7 @@ class ArticleSummarizerApp(QMainWindow):
         self.stats_label.clear()
         self.save_btn.setEnabled(False)
         self.current_summary_id = None
+        self.last_original = ""
         self.summary_list.clearSelection()
     #</editor-fold>
 
@@ -1,13 +1,200 @@
 import sys
 from PyQt6.QtWidgets import (
-    QApplication, QWidget, QPushButton, QGridLayout,
+    QApplication, QWidget, QPushButton,
     QLabel, QVBoxLayout, QHBoxLayout, QMessageBox
 )
-from PyQt6.QtGui import QFont
-from PyQt6.QtCore import Qt
-from collections import deque
+from PyQt6.QtGui import QFont, QColor, QPainter
+from PyQt6.QtCore import Qt, QLineF
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional, the search kernels also run as plain Python
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
 
 ROWS, COLS = 10, 10
+CELL_SIZE = 40
+DEPTH_LIMIT = ROWS + COLS
+
+# Cell kinds stored in MazeSolver.kind, and the colour each is drawn with
+EMPTY, WALL, START, GOAL, VISITED, PATH = range(6)
+KIND_COLORS = [QColor(name) for name in ("white", "black", "green", "red", "lightblue", "yellow")]
+
+# Shared paint resources, built once instead of on every repaint
+GRID_COLOR = QColor("gray")
+GRID_LINES = (
+    [QLineF(0, i * CELL_SIZE, COLS * CELL_SIZE, i * CELL_SIZE) for i in range(ROWS + 1)]
+    + [QLineF(j * CELL_SIZE, 0, j * CELL_SIZE, ROWS * CELL_SIZE) for j in range(COLS + 1)]
+)
+INFO_FONT = QFont("Arial", 14)
+
+# The search kernels work on a (2, ROWS, COLS) bool connection array:
+# conn[0, r, c] is the open edge from (r, c) down to (r + 1, c) and
+# conn[1, r, c] the open edge right to (r, c + 1). Cells are encoded as
+# r * COLS + c. Each kernel returns a parent array holding the code of the
+# cell every reached cell was reached from (-1 if unreached); the start is
+# its own parent.
+
+@njit(cache=True)
+def passable(conn, row, col, r, c):
+    # Whether the move from (row, col) to its neighbour (r, c) is open
+    if r < 0 or r >= ROWS or c < 0 or c >= COLS:
+        return False
+    if r != row:
+        return conn[0, min(r, row), col]
+    return conn[1, row, min(c, col)]
+
+@njit(cache=True)
+def bfs_kernel(conn, sr, sc, gr, gc):
+    parent = np.full((ROWS, COLS), -1, np.int32)
+    queue = np.empty(ROWS * COLS, np.int32)
+    parent[sr, sc] = sr * COLS + sc
+    queue[0] = sr * COLS + sc
+    head, tail = 0, 1
+    while head < tail:
+        row, col = queue[head] // COLS, queue[head] % COLS
+        head += 1
+        if row == gr and col == gc:
+            break
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            r, c = row + dr, col + dc
+            if passable(conn, row, col, r, c) and parent[r, c] == -1:
+                parent[r, c] = row * COLS + col
+                queue[tail] = r * COLS + c
+                tail += 1
+    return parent
+
+@njit(cache=True)
+def dfs_kernel(conn, sr, sc, gr, gc):
+    parent = np.full((ROWS, COLS), -1, np.int32)
+    stack = np.empty(ROWS * COLS, np.int32)
+    parent[sr, sc] = sr * COLS + sc
+    stack[0] = sr * COLS + sc
+    top = 1
+    while top > 0:
+        top -= 1
+        row, col = stack[top] // COLS, stack[top] % COLS
+        if row == gr and col == gc:
+            break
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            r, c = row + dr, col + dc
+            if passable(conn, row, col, r, c) and parent[r, c] == -1:
+                parent[r, c] = row * COLS + col
+                stack[top] = r * COLS + c
+                top += 1
+    return parent
+
+@njit(cache=True)
+def ucs_kernel(conn, sr, sc, gr, gc):
+    # Dijkstra with unit step costs; on a grid this small a linear argmin
+    # over the distances beats keeping a heap
+    unreached = ROWS * COLS + 1
+    parent = np.full((ROWS, COLS), -1, np.int32)
+    dist = np.full(ROWS * COLS, unreached, np.int32)
+    done = np.zeros(ROWS * COLS, np.bool_)
+    parent[sr, sc] = sr * COLS + sc
+    dist[sr * COLS + sc] = 0
+    while True:
+        idx = np.argmin(np.where(done, unreached, dist))
+        if done[idx] or dist[idx] == unreached:
+            break
+        done[idx] = True
+        row, col = idx // COLS, idx % COLS
+        if row == gr and col == gc:
+            break
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            r, c = row + dr, col + dc
+            if passable(conn, row, col, r, c) and dist[idx] + 1 < dist[r * COLS + c]:
+                dist[r * COLS + c] = dist[idx] + 1
+                parent[r, c] = row * COLS + col
+    return parent
+
+@njit(cache=True)
+def depth_limited(conn, sr, sc, gr, gc, limit, parent, depth, stack):
+    # Depth-first search that stops expanding at depth limit, filling the
+    # caller's parent, depth and stack buffers. A cell is pushed again
+    # whenever it is reached by a shorter route, so any path of at most limit
+    # steps is found; each cell has at most limit entries pending.
+    parent[:] = -1
+    depth[:] = limit + 1
+    parent[sr, sc] = sr * COLS + sc
+    depth[sr, sc] = 0
+    stack[0] = sr * COLS + sc
+    top = 1
+    while top > 0:
+        top -= 1
+        row, col = stack[top] // COLS, stack[top] % COLS
+        if row == gr and col == gc:
+            break
+        d = depth[row, col]
+        if d == limit:
+            continue
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            r, c = row + dr, col + dc
+            if passable(conn, row, col, r, c) and depth[r, c] > d + 1:
+                depth[r, c] = d + 1
+                parent[r, c] = row * COLS + col
+                stack[top] = r * COLS + c
+                top += 1
+
+@njit(cache=True)
+def dls_kernel(conn, sr, sc, gr, gc, limit):
+    parent = np.empty((ROWS, COLS), np.int32)
+    depth = np.empty((ROWS, COLS), np.int32)
+    stack = np.empty(ROWS * COLS * (limit + 1) + 1, np.int32)
+    depth_limited(conn, sr, sc, gr, gc, limit, parent, depth, stack)
+    return parent
+
+@njit(cache=True)
+def iddfs_kernel(conn, sr, sc, gr, gc):
+    # Deepen until the goal is reached or every reachable cell was already
+    # within the previous limit. All rounds share one set of buffers, sized
+    # for the deepest possible limit.
+    parent = np.empty((ROWS, COLS), np.int32)
+    depth = np.empty((ROWS, COLS), np.int32)
+    stack = np.empty(ROWS * COLS * ROWS * COLS + 1, np.int32)
+    reached = 0
+    for limit in range(ROWS * COLS):
+        depth_limited(conn, sr, sc, gr, gc, limit, parent, depth, stack)
+        if parent[gr, gc] != -1:
+            break
+        count = np.count_nonzero(parent != -1)
+        if count == reached:
+            break
+        reached = count
+    return parent
+
+if HAVE_NUMBA:
+    # Compile once at import so the first solve doesn't wait for the JIT
+    warm_conn = np.zeros((2, ROWS, COLS), np.bool_)
+    for kernel in (bfs_kernel, dfs_kernel, ucs_kernel, iddfs_kernel):
+        kernel(warm_conn, 0, 0, 0, 0)
+    dls_kernel(warm_conn, 0, 0, 0, 0, 0)
+
+class MazeView(QWidget):
+    # The whole maze as one widget: painted from the solver's kind grid in a
+    # single pass, with clicks mapped back to cells
+    def __init__(self, solver):
+        super().__init__()
+        self.solver = solver
+        self.setFixedSize(COLS * CELL_SIZE + 1, ROWS * CELL_SIZE + 1)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        for (i, j), kind in np.ndenumerate(self.solver.kind):
+            painter.fillRect(j * CELL_SIZE, i * CELL_SIZE, CELL_SIZE, CELL_SIZE, KIND_COLORS[kind])
+        painter.setPen(GRID_COLOR)
+        painter.drawLines(GRID_LINES)
+
+    def mousePressEvent(self, event):
+        pos = event.position()
+        x, y = int(pos.y()) // CELL_SIZE, int(pos.x()) // CELL_SIZE
+        if 0 <= x < ROWS and 0 <= y < COLS:
+            self.solver.toggle_cell(x, y)
 
 class MazeSolver(QWidget):
     def __init__(self):
@@ -15,20 +202,23 @@ class MazeSolver(QWidget):
         self.setWindowTitle("Maze Solver (BFS, DFS, UCS, DLS, IDDFS)")
         self.resize(800, 750)
 
-        self.buttons = {}
-        self.state = {}
+        self.kind = np.full((ROWS, COLS), EMPTY, np.uint8)
+        # Open edges between neighbouring cells, as the search kernels take them
+        self.conn = np.zeros((2, ROWS, COLS), np.bool_)
+        self.conn[0, :-1, :] = True
+        self.conn[1, :, :-1] = True
         self.start_pos = None
         self.goal_pos = None
+        self.setting_mode = "start"
 
         self.create_widgets()
         self.layout_widgets()
-        self.build_grid()
 
     def create_widgets(self):
-        self.grid_layout = QGridLayout()
+        self.maze_view = MazeView(self)
 
         self.info_label = QLabel("Click to set Start, Goal, and Walls")
-        self.info_label.setFont(QFont("Arial", 14))
+        self.info_label.setFont(INFO_FONT)
 
         self.bfs_btn = QPushButton("Solve with BFS")
         self.dfs_btn = QPushButton("Solve with DFS")
@@ -55,49 +245,98 @@ class MazeSolver(QWidget):
 
         layout = QVBoxLayout()
         layout.addWidget(self.info_label)
-        layout.addLayout(self.grid_layout)
+        layout.addWidget(self.maze_view, alignment=Qt.AlignmentFlag.AlignCenter)
         layout.addLayout(control_layout)
         self.setLayout(layout)
 
-    def build_grid(self):
-        for i in range(ROWS):
-            for j in range(COLS):
-                btn = QPushButton("")
-                btn.setFixedSize(40, 40)
-                btn.setStyleSheet("background-color: white;")
-                btn.setFont(QFont("Arial", 10, QFont.Weight.Bold))
-                btn.clicked.connect(lambda _, x=i, y=j: self.toggle_cell(x, y))
-                self.grid_layout.addWidget(btn, i, j)
-                self.buttons[(i, j)] = btn
-                self.state[(i, j)] = "empty"
-
     def toggle_cell(self, x, y):
-        # Logic to toggle cell state
-        pass
+        self.clear_search()
+        if self.setting_mode == "start":
+            if self.start_pos:
+                self.update_cell(*self.start_pos, EMPTY)
+            self.start_pos = (x, y)
+            self.update_cell(x, y, START)
+            self.setting_mode = "goal"
+            self.info_label.setText("Click to set Goal position")
+        elif self.setting_mode == "goal":
+            if self.goal_pos:
+                self.update_cell(*self.goal_pos, EMPTY)
+            self.goal_pos = (x, y)
+            self.update_cell(x, y, GOAL)
+            self.setting_mode = "wall"
+            self.info_label.setText("Click to add/remove walls")
+        elif (x, y) != self.start_pos and (x, y) != self.goal_pos:
+            self.update_cell(x, y, EMPTY if self.kind[x, y] == WALL else WALL)
+
+    def update_cell(self, x, y, kind):
+        was_wall = self.kind[x, y] == WALL
+        self.kind[x, y] = kind
+        if was_wall != (kind == WALL):
+            # Reopen or close the (up to) four edges touching this cell; the
+            # up and left edges are stored on the neighbour above / to the left
+            open_cell = kind != WALL
+            if x > 0:
+                self.conn[0, x - 1, y] = open_cell and self.kind[x - 1, y] != WALL
+            if x < ROWS - 1:
+                self.conn[0, x, y] = open_cell and self.kind[x + 1, y] != WALL
+            if y > 0:
+                self.conn[1, x, y - 1] = open_cell and self.kind[x, y - 1] != WALL
+            if y < COLS - 1:
+                self.conn[1, x, y] = open_cell and self.kind[x, y + 1] != WALL
+        self.maze_view.update()
+
+    def clear_search(self):
+        # Wipe the visited cells and path of the previous search
+        for x, y in np.argwhere(self.kind >= VISITED).tolist():
+            self.update_cell(x, y, EMPTY)
 
     def solve_bfs(self):
-        # Logic to solve maze using BFS
-        pass
+        self.solve_with("BFS", bfs_kernel)
 
     def solve_dfs(self):
-        # Logic to solve maze using DFS
-        pass
+        self.solve_with("DFS", dfs_kernel)
 
     def solve_ucs(self):
-        # Logic to solve maze using UCS
-        pass
+        self.solve_with("UCS", ucs_kernel)
 
     def solve_dls(self):
-        # Logic to solve maze using DLS
-        pass
+        self.solve_with("DLS", lambda *args: dls_kernel(*args, DEPTH_LIMIT))
 
     def solve_iddfs(self):
-        # Logic to solve maze using IDDFS
-        pass
+        self.solve_with("IDDFS", iddfs_kernel)
+
+    def solve_with(self, name, search):
+        if not self.start_pos or not self.goal_pos:
+            self.info_label.setText("Start and Goal must be set!")
+            return
+
+        print(f"Solving with {name}...")
+        self.clear_search()
+        parent = search(self.conn, *self.start_pos, *self.goal_pos)
+        for code in np.flatnonzero(parent != -1).tolist():
+            pos = divmod(code, COLS)
+            if pos != self.start_pos and pos != self.goal_pos:
+                self.update_cell(*pos, VISITED)
+        if parent[self.goal_pos] != -1:
+            self.reconstruct_path(parent)
+            self.info_label.setText("Path found!")
+        else:
+            self.info_label.setText("No path found!")
+
+    def reconstruct_path(self, parent):
+        pos = divmod(int(parent[self.goal_pos]), COLS)
+        while pos != self.start_pos:
+            self.update_cell(*pos, PATH)
+            pos = divmod(int(parent[pos]), COLS)
 
     def clear_grid(self):
-        # Logic to clear the grid
-        pass
+        for x in range(ROWS):
+            for y in range(COLS):
+                self.update_cell(x, y, EMPTY)
+        self.start_pos = None
+        self.goal_pos = None
+        self.setting_mode = "start"
+        self.info_label.setText("Click to set Start, Goal, and Walls")
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
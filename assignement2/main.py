@@ -11,9 +11,11 @@ Technology Used:
 - Database: SQLite3
 """
 
+import os
 import sys
+import re
+import hashlib
 import sqlite3
-from datetime import datetime
 
 # --- PyQt6 Imports ---
 from PyQt6.QtWidgets import (
@@ -21,16 +23,22 @@ from PyQt6.QtWidgets import (
     QTextEdit, QPushButton, QLabel, QListWidget, QListWidgetItem,
     QMessageBox, QSplitter, QStatusBar, QDialog, QProgressBar
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QObject
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, pyqtSlot, QObject
 from PyQt6.QtGui import QFont
 
 # --- AI Model Imports ---
 # To prevent freezing the GUI, the model will be run in a separate thread.
-from transformers import pipeline, Pipeline
+import torch
+from transformers import pipeline, Pipeline, AutoModelForSeq2SeqLM, AutoTokenizer
 
 # --- Global Variables ---
 DB_NAME = "summarization_history.db"
 SUMMARIZER_MODEL = "sshleifer/distilbart-cnn-12-6"
+HISTORY_PAGE_SIZE = 200 # History rows loaded at a time; older ones load on scroll
+CHUNK_WORDS = 400 # Longer articles are split into chunks of about this many words
+SUMMARY_BATCH_SIZE = 4 # Chunks the pipeline summarizes together in one batch
+MAX_COMBINED_WORDS = 300 # Joined chunk summaries longer than this get one more pass
+MIN_MODEL_WORDS = 60 # Shorter texts are already summary-sized and skip the model
 
 # --- Database Management ---
 def initialize_database():
@@ -43,55 +51,106 @@ def initialize_database():
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 original_text TEXT NOT NULL,
                 summary_text TEXT NOT NULL,
-                created_at TEXT NOT NULL
+                created_at TEXT NOT NULL DEFAULT (datetime('now', 'localtime')),
+                input_hash TEXT
             )
         """)
+        # Databases from before the summary cache lack the hash column
+        columns = [row[1] for row in cursor.execute("PRAGMA table_info(history)")]
+        if "input_hash" not in columns:
+            cursor.execute("ALTER TABLE history ADD COLUMN input_hash TEXT")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_input_hash ON history (input_hash)")
         conn.commit()
         conn.close()
     except sqlite3.Error as e:
         print(f"Database error: {e}")
         sys.exit(1)
 
+def hash_input(text):
+    """Returns the SHA-256 hex digest identifying an article's text in the history."""
+    return hashlib.sha256(text.strip().encode("utf-8")).hexdigest()
+
+# --- AI Model Loading ---
+def load_summarizer_pipeline():
+    """
+    Builds the summarization pipeline with the model's linear layers
+    dynamically quantized to int8, which runs faster and uses less memory
+    on CPU than the default fp32 weights.
+    """
+    # Use all but one core for inference, leaving one for the GUI; torch's
+    # own default can end up at a single thread in frozen builds
+    torch.set_num_threads(max(1, (os.cpu_count() or 2) - 1))
+    try:
+        torch.set_num_interop_threads(2)
+    except RuntimeError:
+        pass # Only allowed before torch has started any parallel work
+    tokenizer = AutoTokenizer.from_pretrained(SUMMARIZER_MODEL)
+    model = AutoModelForSeq2SeqLM.from_pretrained(SUMMARIZER_MODEL)
+    model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return pipeline("summarization", model=model, tokenizer=tokenizer)
+
+def split_into_chunks(text, chunk_words=CHUNK_WORDS):
+    """
+    Splits text at sentence ends into chunks of roughly chunk_words words.
+    Attention cost grows faster than the input length, so several short
+    chunks summarize quicker than one long sequence.
+    """
+    chunks = []
+    current = []
+    current_words = 0
+    for sentence in re.split(r"(?<=[.!?])\s+", text):
+        sentence_words = len(sentence.split())
+        if current and current_words + sentence_words > chunk_words:
+            chunks.append(" ".join(current))
+            current = []
+            current_words = 0
+        current.append(sentence)
+        current_words += sentence_words
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+def summary_lengths(num_words):
+    """Returns the (min_length, max_length) to request for a text of num_words words."""
+    max_len = min(150, int(num_words * 0.5))
+    return min(max(25, int(num_words * 0.1)), max_len), max_len
+
 # --- AI Summarization Worker ---
 class SummarizerWorker(QObject):
     """
     A worker object that runs the summarization task in a separate thread
-    to prevent the GUI from freezing.
+    to prevent the GUI from freezing. One worker lives on one thread for the
+    app's lifetime and takes each article through submit.
     """
     finished = pyqtSignal(str)
     error = pyqtSignal(str)
     
     _summarizer_pipeline: Pipeline = None
 
-    def __init__(self, text_to_summarize):
+    def __init__(self, text_to_summarize=""):
         super().__init__()
         self.text_to_summarize = text_to_summarize
 
+    @pyqtSlot(str)
+    def submit(self, text_to_summarize):
+        """Summarizes the given text on the worker's thread."""
+        self.text_to_summarize = text_to_summarize
+        self.run()
+
     def run(self):
         """The main task to be executed by the thread."""
         try:
             # Initialize the pipeline only once and reuse it
             if SummarizerWorker._summarizer_pipeline is None:
                 print("Initializing summarization pipeline for the first time...")
-                SummarizerWorker._summarizer_pipeline = pipeline("summarization", model=SUMMARIZER_MODEL)
+                SummarizerWorker._summarizer_pipeline = load_summarizer_pipeline()
                 print("Pipeline initialized successfully.")
 
             # Perform summarization
-            # We calculate min/max length for better results on various text sizes
-            words = self.text_to_summarize.split()
-            num_words = len(words)
-            min_len = max(25, int(num_words * 0.1))
-            max_len = min(150, int(num_words * 0.5))
-
-            summary = SummarizerWorker._summarizer_pipeline(
-                self.text_to_summarize,
-                max_length=max_len,
-                min_length=min_len,
-                do_sample=False
-            )
-            
-            if summary and isinstance(summary, list):
-                self.finished.emit(summary[0]['summary_text'])
+            summary_text = self.summarize(self.text_to_summarize)
+
+            if summary_text is not None:
+                self.finished.emit(summary_text)
             else:
                 self.error.emit("Summarization failed to produce a valid result.")
 
@@ -100,16 +159,104 @@ class SummarizerWorker(QObject):
             error_message = f"An error occurred during summarization:\n{str(e)}"
             self.error.emit(error_message)
 
+    def summarize(self, text):
+        """
+        Summarizes text of any length; returns None if the model gave nothing back.
+        Longer articles are summarized chunk by chunk, and the joined chunk
+        summaries go through the same path again until they are short enough.
+        """
+        # We calculate min/max length for better results on various text sizes
+        num_words = len(text.split())
+        if num_words <= CHUNK_WORDS:
+            return self.summarize_once(text, num_words)
+
+        summary_text = self.summarize_chunks(split_into_chunks(text))
+        if summary_text is not None and len(summary_text.split()) > MAX_COMBINED_WORDS:
+            return self.summarize(summary_text)
+        return summary_text
+
+    def summarize_once(self, text, num_words):
+        """Summarizes text in a single pipeline call; returns None if nothing came back."""
+        min_len, max_len = summary_lengths(num_words)
+        summary = SummarizerWorker._summarizer_pipeline(
+            text,
+            max_length=max_len,
+            min_length=min_len,
+            do_sample=False,
+            truncation=True
+        )
+        if summary and isinstance(summary, list):
+            return summary[0]['summary_text']
+        return None
+
+    def summarize_chunks(self, chunks):
+        """Summarizes chunks in batches and joins the results; returns None if any came back empty."""
+        # Length limits follow each chunk's size, rounded down to 50 words so
+        # chunks of similar size still share one batched call
+        groups = {}
+        for i, chunk in enumerate(chunks):
+            num_words = len(chunk.split())
+            if num_words >= 50:
+                num_words -= num_words % 50
+            groups.setdefault(summary_lengths(num_words), []).append(i)
+
+        summaries = [None] * len(chunks)
+        for (min_len, max_len), indices in groups.items():
+            outputs = SummarizerWorker._summarizer_pipeline(
+                [chunks[i] for i in indices],
+                max_length=max_len,
+                min_length=min_len,
+                do_sample=False,
+                truncation=True,
+                batch_size=SUMMARY_BATCH_SIZE
+            )
+            if not outputs or not isinstance(outputs, list) or len(outputs) != len(indices):
+                return None
+            for i, output in zip(indices, outputs):
+                summaries[i] = output['summary_text']
+        return " ".join(summaries)
+
+
+class PipelineLoaderWorker(QObject):
+    """
+    Loads the summarization pipeline in the background at startup, so the
+    first click doesn't wait for the model download and load.
+    """
+    finished = pyqtSignal()
+    error = pyqtSignal(str)
+
+    def run(self):
+        try:
+            if SummarizerWorker._summarizer_pipeline is None:
+                print("Initializing summarization pipeline at startup...")
+                SummarizerWorker._summarizer_pipeline = load_summarizer_pipeline()
+                print("Pipeline initialized successfully.")
+            self.finished.emit()
+        except Exception as e:
+            self.error.emit(f"Failed to load the AI model:\n{str(e)}")
+
 
 # --- Main Application Window ---
 class SummarizerApp(QMainWindow):
+    summarize_requested = pyqtSignal(str) # Queued over to the persistent worker
+
     def __init__(self):
         super().__init__()
-        self.db_conn = None
+        # One connection for the app's lifetime instead of one per action
+        self.db_conn = sqlite3.connect(DB_NAME, check_same_thread=False)
+        self.db_conn.execute("PRAGMA journal_mode=WAL")
+        self.db_conn.execute("PRAGMA synchronous=NORMAL")
         self.summarization_thread = None
         self.worker = None
+        self.loader_thread = None
+        self.loader = None
+        self.history_oldest_id = None # Smallest id shown so far, where the next page starts
+        self.pending_text = None # Text handed to the worker; the editor may change before it finishes
+        self.history_exhausted = False
         self.initUI()
         self.load_history()
+        self.start_pipeline_loader()
+        self.start_summarization_worker()
 
     def initUI(self):
         """Sets up the user interface."""
@@ -165,7 +312,9 @@ class SummarizerApp(QMainWindow):
         history_label = QLabel("History")
         history_label.setFont(QFont("Arial", 11, QFont.Weight.Bold))
         self.history_list = QListWidget()
+        self.history_list.setUniformItemSizes(True) # Every entry is a date line plus a snippet
         self.history_list.itemClicked.connect(self.display_history_item)
+        self.history_list.verticalScrollBar().valueChanged.connect(self.on_history_scrolled)
         
         right_layout.addWidget(history_label)
         right_layout.addWidget(self.history_list)
@@ -182,7 +331,57 @@ class SummarizerApp(QMainWindow):
         # --- Status Bar ---
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
-        self.status_bar.showMessage("Ready. The first summarization will download the AI model.", 5000)
+
+    def start_pipeline_loader(self):
+        """Warms up the AI model on a background thread while the user pastes text."""
+        self.summarize_button.setEnabled(False)
+        self.summarize_button.setText("Loading AI model...")
+        self.status_bar.showMessage("Loading the AI model. The first launch also downloads it.")
+
+        self.loader_thread = QThread()
+        self.loader = PipelineLoaderWorker()
+        self.loader.moveToThread(self.loader_thread)
+
+        self.loader_thread.started.connect(self.loader.run)
+        self.loader.finished.connect(self.on_pipeline_ready)
+        self.loader.error.connect(self.on_pipeline_error)
+
+        # Clean up after the load; the thread object itself is kept so
+        # closeEvent can still check it
+        self.loader.finished.connect(self.loader_thread.quit)
+        self.loader.error.connect(self.loader_thread.quit)
+        self.loader.finished.connect(self.loader.deleteLater)
+        self.loader.error.connect(self.loader.deleteLater)
+
+        self.loader_thread.start()
+
+    def start_summarization_worker(self):
+        """Starts the one worker thread that every summarization runs on."""
+        self.summarization_thread = QThread()
+        self.worker = SummarizerWorker()
+        self.worker.moveToThread(self.summarization_thread)
+
+        self.summarize_requested.connect(self.worker.submit, Qt.ConnectionType.QueuedConnection)
+        self.worker.finished.connect(self.on_summary_complete)
+        self.worker.error.connect(self.on_summary_error)
+        self.summarization_thread.finished.connect(self.worker.deleteLater)
+
+        self.summarization_thread.start()
+
+    def on_pipeline_ready(self):
+        """Slot to handle the finished signal from the model loader."""
+        self.summarize_button.setEnabled(True)
+        self.summarize_button.setText("Summarize Text")
+        self.status_bar.showMessage("Ready. The AI model is loaded.", 5000)
+
+    def on_pipeline_error(self, error_message):
+        """Slot to handle the error signal from the model loader."""
+        QMessageBox.critical(self, "Error", error_message)
+
+        # Summarizing retries the load, so leave the button usable
+        self.summarize_button.setEnabled(True)
+        self.summarize_button.setText("Summarize Text")
+        self.status_bar.showMessage("The AI model could not be loaded.", 5000)
 
     def run_summarization(self):
         """Handles the 'Summarize' button click event."""
@@ -191,32 +390,34 @@ class SummarizerApp(QMainWindow):
             QMessageBox.warning(self, "Input Error", "Please enter some text to summarize.")
             return
 
+        # The same text was summarized before, so reuse that summary instead of the model
+        cached_summary = self.find_cached_summary(article_text)
+        if cached_summary is not None:
+            self.output_text.setText(cached_summary)
+            self.status_bar.showMessage("Loaded the saved summary for this text.", 5000)
+            return
+
+        # Too short for the model to shorten meaningfully; keep the text as its own summary
+        if len(article_text.split()) < MIN_MODEL_WORDS:
+            self.output_text.setText(article_text)
+            self.save_to_history(article_text, article_text)
+            self.load_history()
+            self.status_bar.showMessage("The text is already short, so it was kept as is.", 5000)
+            return
+
         # Disable button and show status
         self.summarize_button.setEnabled(False)
         self.summarize_button.setText("Summarizing...")
         self.status_bar.showMessage("Processing... This may take a moment, especially the first time.")
 
-        # Create and start the worker thread
-        self.summarization_thread = QThread()
-        self.worker = SummarizerWorker(article_text)
-        self.worker.moveToThread(self.summarization_thread)
-
-        # Connect signals
-        self.summarization_thread.started.connect(self.worker.run)
-        self.worker.finished.connect(self.on_summary_complete)
-        self.worker.error.connect(self.on_summary_error)
-        
-        # Clean up after the thread finishes
-        self.worker.finished.connect(self.summarization_thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.summarization_thread.finished.connect(self.summarization_thread.deleteLater)
-
-        self.summarization_thread.start()
+        # Hand the text to the worker thread
+        self.pending_text = article_text
+        self.summarize_requested.emit(article_text)
 
     def on_summary_complete(self, summary):
         """Slot to handle the finished signal from the worker."""
         self.output_text.setText(summary)
-        self.save_to_history(self.input_text.toPlainText().strip(), summary)
+        self.save_to_history(self.pending_text, summary)
         self.load_history()
         
         # Re-enable button and clear status
@@ -234,61 +435,101 @@ class SummarizerApp(QMainWindow):
         self.summarize_button.setText("Summarize Text")
         self.status_bar.showMessage("An error occurred.", 5000)
 
+    def find_cached_summary(self, article_text):
+        """Returns the stored summary of an identical earlier article, or None."""
+        try:
+            cursor = self.db_conn.cursor()
+            cursor.execute("SELECT summary_text FROM history WHERE input_hash = ? LIMIT 1",
+                           (hash_input(article_text),))
+            record = cursor.fetchone()
+            return record[0] if record else None
+        except sqlite3.Error:
+            return None # Fall back to running the model
+
     def save_to_history(self, original, summary):
         """Saves a new summary record to the database."""
         try:
-            self.db_conn = sqlite3.connect(DB_NAME)
             cursor = self.db_conn.cursor()
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            # SQLite stamps the row itself; spelled out rather than left to the
+            # column default so databases created before the default still work
             cursor.execute(
-                "INSERT INTO history (original_text, summary_text, created_at) VALUES (?, ?, ?)",
-                (original, summary, timestamp)
+                "INSERT INTO history (original_text, summary_text, created_at, input_hash) "
+                "VALUES (?, ?, datetime('now', 'localtime'), ?)",
+                (original, summary, hash_input(original))
             )
             self.db_conn.commit()
-            self.db_conn.close()
         except sqlite3.Error as e:
             QMessageBox.critical(self, "Database Error", f"Failed to save history: {e}")
 
     def load_history(self):
-        """Loads summarization history from the database into the list widget."""
+        """Loads the most recent page of summarization history into the list widget."""
         self.history_list.clear()
+        self.history_oldest_id = None
+        self.history_exhausted = False
+        self.load_more_history()
+
+    def load_more_history(self):
+        """Appends the next page of older history records to the list widget."""
+        if self.history_exhausted:
+            return
         try:
-            self.db_conn = sqlite3.connect(DB_NAME)
             cursor = self.db_conn.cursor()
-            cursor.execute("SELECT id, summary_text, created_at FROM history ORDER BY id DESC")
+            # Page by id rather than OFFSET, so SQLite seeks straight to the next rows
+            if self.history_oldest_id is None:
+                cursor.execute("SELECT id, summary_text, created_at FROM history ORDER BY id DESC LIMIT ?",
+                               (HISTORY_PAGE_SIZE,))
+            else:
+                cursor.execute("SELECT id, summary_text, created_at FROM history WHERE id < ? ORDER BY id DESC LIMIT ?",
+                               (self.history_oldest_id, HISTORY_PAGE_SIZE))
             records = cursor.fetchall()
-            for record in records:
-                item_id, summary_text, created_at = record
-                # Create a display text with a snippet of the summary
-                display_text = f"{created_at}\n{summary_text[:60]}..."
-                list_item = QListWidgetItem(display_text)
-                list_item.setData(Qt.ItemDataRole.UserRole, item_id) # Store DB id in the item
-                self.history_list.addItem(list_item)
-            self.db_conn.close()
+            # Add the whole page behind one repaint and no per-item signals
+            self.history_list.setUpdatesEnabled(False)
+            self.history_list.blockSignals(True)
+            try:
+                for record in records:
+                    item_id, summary_text, created_at = record
+                    # Create a display text with a snippet of the summary
+                    display_text = f"{created_at}\n{summary_text[:60]}..."
+                    list_item = QListWidgetItem(display_text)
+                    list_item.setData(Qt.ItemDataRole.UserRole, item_id) # Store DB id in the item
+                    self.history_list.addItem(list_item)
+            finally:
+                self.history_list.blockSignals(False)
+                self.history_list.setUpdatesEnabled(True)
+            if records:
+                self.history_oldest_id = records[-1][0]
+            self.history_exhausted = len(records) < HISTORY_PAGE_SIZE
         except sqlite3.Error as e:
             QMessageBox.critical(self, "Database Error", f"Failed to load history: {e}")
 
+    def on_history_scrolled(self, value):
+        """Loads older history once the list is scrolled to the bottom."""
+        if value == self.history_list.verticalScrollBar().maximum():
+            self.load_more_history()
+
     def display_history_item(self, item):
         """Fetches and displays the full text of a clicked history item."""
         item_id = item.data(Qt.ItemDataRole.UserRole)
         try:
-            self.db_conn = sqlite3.connect(DB_NAME)
             cursor = self.db_conn.cursor()
             cursor.execute("SELECT original_text, summary_text FROM history WHERE id = ?", (item_id,))
             record = cursor.fetchone()
             if record:
                 self.input_text.setText(record[0])
                 self.output_text.setText(record[1])
-            self.db_conn.close()
         except sqlite3.Error as e:
             QMessageBox.critical(self, "Database Error", f"Failed to retrieve history item: {e}")
             
     def closeEvent(self, event):
         """Handle the window close event."""
         # Ensure thread is properly terminated if app is closed while running
+        if self.loader_thread and self.loader_thread.isRunning():
+            self.loader_thread.quit()
+            self.loader_thread.wait() # Wait for the model load to finish
         if self.summarization_thread and self.summarization_thread.isRunning():
             self.summarization_thread.quit()
-            self.summarization_thread.wait() # Wait for the thread to finish
+            self.summarization_thread.wait() # Wait for a running summary to finish
+        self.db_conn.close()
         event.accept()
 
 
@@ -1,6 +1,9 @@
 import sys
 import sqlite3
 import re
+import hashlib
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
                             QWidget, QPushButton, QTextEdit, QLabel, QListWidget, 
@@ -12,8 +15,17 @@ import nltk
 from nltk.tokenize import sent_tokenize, word_tokenize
 from nltk.corpus import stopwords
 from nltk.stem import PorterStemmer
-from collections import Counter
 import heapq
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional, the scoring kernel also runs as plain Python
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
 
 # Download required NLTK data (run once)
 def download_nltk_data():
@@ -33,95 +45,144 @@ def download_nltk_data():
 # Ensure NLTK data is available
 download_nltk_data()
 
+# Load the punkt models now rather than on the first summary
+try:
+    word_tokenize("Warm up the tokenizer.")
+except (LookupError, OSError):
+    pass  # TextSummarizer falls back to its regex tokenizers
+
+@njit(cache=True)
+def sum_word_freqs(word_ids, offsets, freqs):
+    """Total frequency of each sentence's words; sentence i owns word_ids[offsets[i]:offsets[i + 1]]"""
+    totals = np.zeros(len(offsets) - 1)
+    for i in range(len(totals)):
+        total = 0.0
+        for k in range(offsets[i], offsets[i + 1]):
+            if word_ids[k] >= 0:  # -1 marks a word missing from the frequency table
+                total += freqs[word_ids[k]]
+        totals[i] = total
+    return totals
+
+if HAVE_NUMBA:
+    # Compile once at import so the first summary doesn't wait for the JIT
+    sum_word_freqs(np.zeros(1, dtype=np.int64), np.array([0, 1], dtype=np.int64), np.zeros(1))
+
 class TextSummarizer:
     """Local AI model for text summarization using extractive approach"""
     
+    # Loaded once at import and shared by every instance
+    STEMMER = PorterStemmer()
+    try:
+        STOP_WORDS = frozenset(stopwords.words('english'))
+    except LookupError:
+        # Download stopwords if not available
+        nltk.download('stopwords', quiet=True)
+        STOP_WORDS = frozenset(stopwords.words('english'))
+    WHITESPACE_RE = re.compile(r'\s+')
+    # A sentence for the fallback splitter: a run between sentence ends that
+    # starts and ends on a non-space, so matches come out already stripped
+    SENTENCE_RE = re.compile(r'[^.!?\s](?:[^.!?]*[^.!?\s])?')
+    WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+    # Keywords that often indicate important content, matched anywhere in
+    # the sentence in one case-insensitive pass, without lowercasing it first
+    KEYWORD_RE = re.compile('significant|important|contributes|produces|economic|cultural|traditional|ecological|benefits',
+                            re.IGNORECASE)
+    # Digits and the first letter of candidate proper nouns (words of 3+
+    # characters not starting with a lowercase ASCII letter), found in one
+    # scan of the sentence. Only the initial is consumed, so digits later in
+    # the word still match.
+    FEATURE_RE = re.compile(r'(?P<digit>\d)|(?<!\S)(?P<initial>[^\W\d_a-z])(?=\S{2})')
+    # Recent summaries keyed by a hash of the text and the settings, shared
+    # by all instances (workers run on their own threads, hence the lock)
+    CACHE_SIZE = 32
+    SUMMARY_CACHE = OrderedDict()
+    CACHE_LOCK = threading.Lock()
+    
     def __init__(self):
-        self.stemmer = PorterStemmer()
-        try:
-            self.stop_words = set(stopwords.words('english'))
-        except LookupError:
-            # Download stopwords if not available
-            nltk.download('stopwords', quiet=True)
-            self.stop_words = set(stopwords.words('english'))
+        self.stemmer = self.STEMMER
+        self.stop_words = self.STOP_WORDS
     
     def simple_sentence_split(self, text):
         """Fallback sentence splitting method if NLTK fails"""
-        # Simple sentence splitting based on punctuation
-        import re
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        return sentences
+        # Simple sentence splitting based on punctuation, in a single scan
+        return self.SENTENCE_RE.findall(text)
     
     def simple_word_tokenize(self, text):
         """Fallback word tokenization if NLTK fails"""
-        import re
-        words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
+        words = self.WORD_RE.findall(text.lower())
         return words
     
+    def content_words(self, sentence):
+        """Lowercased words of a sentence, without punctuation and stop words"""
+        try:
+            words = word_tokenize(sentence.lower())
+        except (LookupError, OSError):
+            # Use fallback tokenization
+            words = self.simple_word_tokenize(sentence)
+        stop_words = self.stop_words
+        return [word for word in words if word.isalnum() and word not in stop_words]
+    
+    def sentence_flags(self, sentence):
+        """Whether a sentence has a number, a proper noun and an important keyword"""
+        has_number = has_proper_noun = False
+        for match in self.FEATURE_RE.finditer(sentence):
+            if match.lastgroup == 'digit':
+                has_number = True
+            elif match.group('initial').isupper():
+                has_proper_noun = True
+            if has_number and has_proper_noun:
+                break
+        has_keyword = self.KEYWORD_RE.search(sentence) is not None
+        return has_number, has_proper_noun, has_keyword
+    
     def preprocess_text(self, text):
         """Clean and preprocess the text"""
         # Remove extra whitespace and newlines
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = self.WHITESPACE_RE.sub(' ', text.strip())
         return text
     
-    def calculate_sentence_scores(self, sentences, word_freq):
-        """Calculate scores for each sentence based on word frequencies and position"""
-        sentence_scores = {}
-        
-        for i, sentence in enumerate(sentences):
-            try:
-                words = word_tokenize(sentence.lower())
-            except (LookupError, OSError):
-                # Use fallback tokenization
-                words = self.simple_word_tokenize(sentence)
-            
-            words = [word for word in words if word.isalnum() and word not in self.stop_words]
-            
-            if len(words) > 0:
-                # Base score from word frequencies
-                score = 0
-                for word in words:
-                    if word in word_freq:
-                        score += word_freq[word]
-                
-                # Normalize by sentence length
-                score = score / len(words)
-                
-                # Boost score for sentences at beginning and end (often more important)
-                position_boost = 1.0
-                if i == 0:  # First sentence
-                    position_boost = 1.3
-                elif i == len(sentences) - 1:  # Last sentence
-                    position_boost = 1.2
-                elif i < len(sentences) * 0.3:  # First third of text
-                    position_boost = 1.1
-                
-                # Boost score for longer sentences (often contain more information)
-                length_boost = min(1.5, len(words) / 15.0) if len(words) > 10 else 0.8
-                
-                # Check for numbers, proper nouns, and important keywords
-                importance_boost = 1.0
-                sentence_lower = sentence.lower()
-                if any(char.isdigit() for char in sentence):
-                    importance_boost += 0.2  # Numbers often indicate important facts
-                if any(word[0].isupper() for word in sentence.split() if len(word) > 2):
-                    importance_boost += 0.1  # Proper nouns
-                
-                # Keywords that often indicate important content
-                important_keywords = ['significant', 'important', 'contributes', 'produces', 
-                                    'economic', 'cultural', 'traditional', 'ecological', 'benefits']
-                if any(keyword in sentence_lower for keyword in important_keywords):
-                    importance_boost += 0.15
-                
-                final_score = score * position_boost * length_boost * importance_boost
-                sentence_scores[sentence] = final_score
-        
-        return sentence_scores
+    def calculate_sentence_scores(self, sentences, sentence_tokens, word_ids, word_freq):
+        """Calculate scores for each sentence based on word frequencies and position
+        
+        sentence_tokens holds the content words of each sentence, as returned
+        by content_words, so no sentence is tokenized twice. word_ids numbers
+        those words in the same order, flattened, and word_freq[i] is the
+        normalized frequency of word i. Returns an array with one score per
+        sentence; sentences without content words score -inf.
+        """
+        num_sentences = len(sentences)
+        lengths = np.fromiter((len(words) for words in sentence_tokens), dtype=np.int64, count=num_sentences)
+        offsets = np.zeros(num_sentences + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        totals = sum_word_freqs(word_ids, offsets, word_freq)
+        
+        # Base score from word frequencies, normalized by sentence length
+        scores = totals / np.maximum(lengths, 1)
+        
+        # Boost score for sentences at beginning and end (often more important),
+        # and slightly for the rest of the first third of the text
+        position_boost = np.where(np.arange(num_sentences) < num_sentences * 0.3, 1.1, 1.0)
+        position_boost[-1] = 1.2
+        position_boost[0] = 1.3
+        
+        # Boost score for longer sentences (often contain more information)
+        length_boost = np.where(lengths > 10, np.minimum(1.5, lengths / 15.0), 0.8)
+        
+        # Check for numbers, proper nouns, and important keywords
+        flags = np.array([self.sentence_flags(sentence) for sentence in sentences],
+                         dtype=bool).reshape(num_sentences, 3)
+        has_number, has_proper_noun, has_keyword = flags.T
+        # Numbers often indicate important facts
+        importance_boost = 1.0 + 0.2 * has_number + 0.1 * has_proper_noun + 0.15 * has_keyword
+        
+        scores = scores * position_boost * length_boost * importance_boost
+        scores[lengths == 0] = -np.inf
+        return scores
     
     def summarize(self, text, ratio=0.4, min_sentences=2, max_sentences=8):
         """
-        Summarize text using extractive summarization
+        Summarize text using extractive summarization, reusing the result
+        when the same text was summarized recently with the same settings
         
         Args:
             text (str): Input text to summarize
@@ -132,9 +193,32 @@ class TextSummarizer:
         Returns:
             str: Summarized text
         """
+        if not text:
+            return self.build_summary(text, ratio, min_sentences, max_sentences)
+        
+        key = (hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest(), ratio, min_sentences, max_sentences)
+        with self.CACHE_LOCK:
+            if key in self.SUMMARY_CACHE:
+                self.SUMMARY_CACHE.move_to_end(key)
+                return self.SUMMARY_CACHE[key]
+        
+        summary = self.build_summary(text, ratio, min_sentences, max_sentences)
+        with self.CACHE_LOCK:
+            self.SUMMARY_CACHE[key] = summary
+            if len(self.SUMMARY_CACHE) > self.CACHE_SIZE:
+                self.SUMMARY_CACHE.popitem(last=False)
+        return summary
+    
+    def build_summary(self, text, ratio, min_sentences, max_sentences):
+        """Summarize text without the cache; see summarize"""
         if not text or len(text.strip()) < 100:
             return "Text too short to summarize effectively."
         
+        # At most one sentence end means at most two sentences, which would be
+        # returned unchanged below, so skip the tokenizers
+        if text.count('.') + text.count('!') + text.count('?') < 2:
+            return self.preprocess_text(text)
+        
         # Preprocess text
         text = self.preprocess_text(text)
         
@@ -156,146 +240,145 @@ class TextSummarizer:
         if len(sentences) < 3:
             return text  # Return original if too few sentences
         
-        try:
-            # Calculate word frequencies
-            words = word_tokenize(text.lower())
-        except (LookupError, OSError) as e:
-            # If NLTK fails, try to download data or use fallback
-            try:
-                if 'punkt' in str(e):
-                    nltk.download('punkt', quiet=True)
-                    words = word_tokenize(text.lower())
-                else:
-                    raise e
-            except:
-                # Use simple fallback method
-                words = self.simple_word_tokenize(text)
-        words = [word for word in words if word.isalnum() and word not in self.stop_words]
-        word_freq = Counter(words)
+        # Tokenize each sentence once; the frequencies and the scores both use these
+        sentence_tokens = [self.content_words(sentence) for sentence in sentences]
         
-        # Normalize word frequencies
-        max_freq = max(word_freq.values())
-        for word in word_freq:
-            word_freq[word] = word_freq[word] / max_freq
+        # Number each distinct word in order of appearance, then count and
+        # normalize the word frequencies on the id array
+        vocab = {}
+        word_ids = np.fromiter((vocab.setdefault(word, len(vocab)) for words in sentence_tokens for word in words),
+                               dtype=np.int64, count=sum(len(words) for words in sentence_tokens))
+        word_freq = np.bincount(word_ids)
+        word_freq = word_freq / word_freq.max()
         
         # Calculate sentence scores
-        sentence_scores = self.calculate_sentence_scores(sentences, word_freq)
+        sentence_scores = self.calculate_sentence_scores(sentences, sentence_tokens, word_ids, word_freq)
         
         # Determine number of sentences for summary
         num_sentences = max(min_sentences, 
                           min(max_sentences, 
                               int(len(sentences) * ratio)))
         
-        # Select top sentences
-        top_sentences = heapq.nlargest(num_sentences, sentence_scores, 
-                                     key=sentence_scores.get)
+        # Select top sentences by index, so repeated sentences are scored
+        # separately; on equal scores the earlier sentence wins
+        score_list = sentence_scores.tolist()
+        scored = [i for i, score in enumerate(score_list) if score != float('-inf')]
+        top_indices = heapq.nlargest(num_sentences, scored, key=score_list.__getitem__)
         
         # Maintain original order
-        summary_sentences = []
-        for sentence in sentences:
-            if sentence in top_sentences:
-                summary_sentences.append(sentence)
-        
-        return ' '.join(summary_sentences)
+        keep = np.zeros(len(sentences), dtype=bool)
+        keep[top_indices] = True
+        return ' '.join(sentences[i] for i in np.flatnonzero(keep))
 
 class SummarizationWorker(QThread):
     """Worker thread for text summarization to prevent UI freezing"""
-    finished = pyqtSignal(str)
+    finished = pyqtSignal(str, int, int)  # summary, original words, summary words
     error = pyqtSignal(str)
     
-    def __init__(self, text, ratio=0.3):
+    def __init__(self, text, ratio=0.3, summarizer=None):
         super().__init__()
         self.text = text
         self.ratio = ratio
-        self.summarizer = TextSummarizer()
+        self.summarizer = summarizer or TextSummarizer()
     
     def run(self):
         try:
             summary = self.summarizer.summarize(self.text, self.ratio)
-            self.finished.emit(summary)
+            # Count words here too, so the GUI thread never splits the article
+            self.finished.emit(summary, len(self.text.split()), len(summary.split()))
         except Exception as e:
             self.error.emit(str(e))
 
 class DatabaseManager:
     """Handle SQLite database operations"""
     
+    INSERT_SQL = '''
+        INSERT INTO summaries (title, original_text, summary_text, 
+                             word_count_original, word_count_summary)
+        VALUES (?, ?, ?, ?, ?)
+    '''
+    
     def __init__(self, db_name="article_summaries.db"):
         self.db_name = db_name
+        # One connection for the app's lifetime instead of one per call; it
+        # keeps the compiled form of the statements it has run
+        self.conn = sqlite3.connect(db_name, check_same_thread=False, cached_statements=128)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA temp_store=MEMORY')
         self.init_database()
     
     def init_database(self):
         """Initialize the database and create tables"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS summaries (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                original_text TEXT NOT NULL,
-                summary_text TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                word_count_original INTEGER,
-                word_count_summary INTEGER
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-    
-    def save_summary(self, title, original_text, summary_text):
-        """Save a summary to the database"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        word_count_original = len(original_text.split())
-        word_count_summary = len(summary_text.split())
-        
-        cursor.execute('''
-            INSERT INTO summaries (title, original_text, summary_text, 
-                                 word_count_original, word_count_summary)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (title, original_text, summary_text, word_count_original, word_count_summary))
-        
-        conn.commit()
-        conn.close()
+        with self.conn:
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS summaries (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT NOT NULL,
+                    original_text TEXT NOT NULL,
+                    summary_text TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    word_count_original INTEGER,
+                    word_count_summary INTEGER
+                )
+            ''')
+            # Lets get_all_summaries read rows in order instead of sorting them
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_summaries_created ON summaries(created_at DESC)')
+    
+    def save_summary(self, title, original_text, summary_text, word_count_original=None, word_count_summary=None):
+        """Save a summary to the database, counting the words unless the counts are given"""
+        if word_count_original is None:
+            word_count_original = len(original_text.split())
+        if word_count_summary is None:
+            word_count_summary = len(summary_text.split())
+        
+        with self.conn:
+            cursor = self.conn.execute(self.INSERT_SQL, (title, original_text, summary_text,
+                                                         word_count_original, word_count_summary))
         return cursor.lastrowid
     
+    def save_summaries(self, summaries):
+        """Save several (title, original_text, summary_text) summaries in one transaction"""
+        rows = [(title, original_text, summary_text, len(original_text.split()), len(summary_text.split()))
+                for title, original_text, summary_text in summaries]
+        with self.conn:
+            self.conn.executemany(self.INSERT_SQL, rows)
+    
     def get_all_summaries(self):
         """Retrieve all summaries from the database"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
+        return self.conn.execute('''
             SELECT id, title, created_at, word_count_original, word_count_summary
             FROM summaries ORDER BY created_at DESC
-        ''')
-        
-        summaries = cursor.fetchall()
-        conn.close()
-        return summaries
+        ''').fetchall()
     
-    def get_summary_by_id(self, summary_id):
-        """Get a specific summary by ID"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT * FROM summaries WHERE id = ?
-        ''', (summary_id,))
-        
-        summary = cursor.fetchone()
-        conn.close()
-        return summary
+    def get_summary_listing(self, summary_id):
+        """Get one summary's row in the shape get_all_summaries returns"""
+        return self.conn.execute('''
+            SELECT id, title, created_at, word_count_original, word_count_summary
+            FROM summaries WHERE id = ?
+        ''', (summary_id,)).fetchone()
+    
+    def get_summary_meta(self, summary_id):
+        """Get just the title, date and word counts of a specific summary by ID"""
+        return self.conn.execute('''
+            SELECT title, created_at, word_count_original, word_count_summary
+            FROM summaries WHERE id = ?
+        ''', (summary_id,)).fetchone()
+    
+    def get_summary_full(self, summary_id):
+        """Get the original and summary texts of a specific summary by ID"""
+        return self.conn.execute('''
+            SELECT original_text, summary_text FROM summaries WHERE id = ?
+        ''', (summary_id,)).fetchone()
     
     def delete_summary(self, summary_id):
         """Delete a summary from the database"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        cursor.execute('DELETE FROM summaries WHERE id = ?', (summary_id,))
-        conn.commit()
-        conn.close()
+        with self.conn:
+            self.conn.execute('DELETE FROM summaries WHERE id = ?', (summary_id,))
+    
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
 
 class ArticleSummarizerApp(QMainWindow):
     """Main application window"""
@@ -303,8 +386,18 @@ class ArticleSummarizerApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.db_manager = DatabaseManager()
+        self.summarizer = TextSummarizer()  # Shared by every summarization worker
         self.current_summary_id = None
         self.summarization_worker = None
+        self.counted_texts = None  # (original, summary) the word counts below belong to
+        self.word_counts = (0, 0)  # (original, summary) words of the last summary, reused on save
+        
+        # Loads the selected summary's texts once the selection settles, so
+        # clicking through the list doesn't pull every article
+        self.text_load_timer = QTimer(self)
+        self.text_load_timer.setSingleShot(True)
+        self.text_load_timer.setInterval(150)
+        self.text_load_timer.timeout.connect(self.load_selected_texts)
         
         self.setWindowTitle("Article Summarizer")
         self.setGeometry(100, 100, 1200, 800)
@@ -439,19 +532,19 @@ class ArticleSummarizerApp(QMainWindow):
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
         
         # Start summarization in worker thread
-        self.summarization_worker = SummarizationWorker(text, 0.4)
+        self.summarization_worker = SummarizationWorker(text, 0.4, self.summarizer)
         self.summarization_worker.finished.connect(self.on_summarization_finished)
         self.summarization_worker.error.connect(self.on_summarization_error)
         self.summarization_worker.start()
     
-    def on_summarization_finished(self, summary):
+    def on_summarization_finished(self, summary, original_words, summary_words):
         """Handle completed summarization"""
         self.summary_text.setPlainText(summary)
         self.save_btn.setEnabled(True)
+        self.counted_texts = (self.summarization_worker.text, summary)
+        self.word_counts = (original_words, summary_words)
         
         # Update statistics
-        original_words = len(self.original_text.toPlainText().split())
-        summary_words = len(summary.split())
         reduction = ((original_words - summary_words) / original_words) * 100
         
         stats_text = f"Original: {original_words} words | Summary: {summary_words} words | Reduction: {reduction:.1f}%"
@@ -481,41 +574,54 @@ class ArticleSummarizerApp(QMainWindow):
             return
         
         try:
-            summary_id = self.db_manager.save_summary(title, original, summary)
+            # Reuse the worker's counts unless the texts were edited since
+            word_counts = self.word_counts if (original, summary) == self.counted_texts else (None, None)
+            summary_id = self.db_manager.save_summary(title, original, summary, *word_counts)
+            # Newest first, so the new summary goes on top without reloading the list
+            self.insert_summary_item(0, self.db_manager.get_summary_listing(summary_id))
             QMessageBox.information(self, "Success", "Summary saved successfully!")
-            self.load_saved_summaries()
             self.save_btn.setEnabled(False)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save summary: {e}")
     
     def load_saved_summaries(self):
         """Load saved summaries into the list"""
-        self.summary_list.clear()
         summaries = self.db_manager.get_all_summaries()
         
-        for summary in summaries:
-            summary_id, title, created_at, orig_words, summ_words = summary
-            item_text = f"{title}\n{created_at[:16]} | {orig_words}→{summ_words} words"
-            
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, summary_id)
-            self.summary_list.addItem(item)
+        # Rebuild the whole list behind one repaint and no per-item signals
+        self.summary_list.setUpdatesEnabled(False)
+        self.summary_list.blockSignals(True)
+        try:
+            self.summary_list.clear()
+            for row, summary in enumerate(summaries):
+                self.insert_summary_item(row, summary)
+        finally:
+            self.summary_list.blockSignals(False)
+            self.summary_list.setUpdatesEnabled(True)
+    
+    def insert_summary_item(self, row, summary):
+        """Insert one saved summary into the list at the given row"""
+        summary_id, title, created_at, orig_words, summ_words = summary
+        item_text = f"{title}\n{created_at[:16]} | {orig_words}→{summ_words} words"
+        
+        item = QListWidgetItem(item_text)
+        item.setData(Qt.ItemDataRole.UserRole, summary_id)
+        self.summary_list.insertItem(row, item)
     
     def load_selected_summary(self, item):
-        """Load selected summary into the text fields"""
+        """Show the selected summary's title and statistics, and queue its texts"""
         summary_id = item.data(Qt.ItemDataRole.UserRole)
-        summary_data = self.db_manager.get_summary_by_id(summary_id)
+        summary_data = self.db_manager.get_summary_meta(summary_id)
         
         if summary_data:
-            _, title, original, summary, _, _, _ = summary_data
+            title, _, original_words, summary_words = summary_data
             
             self.title_input.setText(title)
-            self.original_text.setPlainText(original)
-            self.summary_text.setPlainText(summary)
+            # The texts follow once the selection settles
+            self.original_text.clear()
+            self.summary_text.clear()
             
-            # Update statistics
-            original_words = len(original.split())
-            summary_words = len(summary.split())
+            # Update statistics from the counts stored with the summary
             reduction = ((original_words - summary_words) / original_words) * 100
             
             stats_text = f"Original: {original_words} words | Summary: {summary_words} words | Reduction: {reduction:.1f}%"
@@ -523,6 +629,17 @@ class ArticleSummarizerApp(QMainWindow):
             
             self.current_summary_id = summary_id
             self.save_btn.setEnabled(False)
+            self.text_load_timer.start()
+    
+    def load_selected_texts(self):
+        """Load the original and summary texts of the selected summary"""
+        if self.current_summary_id is None:
+            return
+        texts = self.db_manager.get_summary_full(self.current_summary_id)
+        if texts:
+            original, summary = texts
+            self.original_text.setPlainText(original)
+            self.summary_text.setPlainText(summary)
     
     def delete_selected_summary(self):
         """Delete the selected summary"""
@@ -539,11 +656,18 @@ class ArticleSummarizerApp(QMainWindow):
             summary_id = current_item.data(Qt.ItemDataRole.UserRole)
             try:
                 self.db_manager.delete_summary(summary_id)
-                self.load_saved_summaries()
+                self.summary_list.takeItem(self.summary_list.row(current_item))
                 QMessageBox.information(self, "Success", "Summary deleted successfully!")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to delete summary: {e}")
     
+    def closeEvent(self, event):
+        """Wait for a running summary and close the database on exit"""
+        if self.summarization_worker:
+            self.summarization_worker.wait()
+        self.db_manager.close()
+        super().closeEvent(event)
+    
     def clear_all_fields(self):
         """Clear all input fields"""
         self.title_input.clear()
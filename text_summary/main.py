@@ -5,7 +5,7 @@ from PyQt6.QtWidgets import (
     QLabel, QMessageBox
 )
 from PyQt6.QtGui import QIcon
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
 
 # --- NEW IMPORTS for Summarization ---
 # We are replacing gensim with sumy, a library dedicated to summarization.
@@ -15,6 +15,50 @@ from sumy.summarizers.lsa import LsaSummarizer as Summarizer # LSA is a good gen
 from sumy.nlp.stemmers import Stemmer
 from sumy.utils import get_stop_words
 
+# Language for summarization
+LANGUAGE = "english"
+# Read once at launch instead of on every click
+STOP_WORDS = get_stop_words(LANGUAGE)
+# Number of sentences in the summary
+SENTENCES_COUNT = 5
+# Uploaded files are read in pieces of this many characters, up to the limit
+UPLOAD_CHUNK_CHARS = 256 * 1024
+MAX_UPLOAD_CHARS = 5 * 1024 * 1024
+
+
+class SumyWorker(QThread):
+    """Runs one summarization off the GUI thread, so long texts don't freeze the window."""
+    summary_ready = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+    def __init__(self, text, tokenizer, summarizer, sentences_count, parent=None):
+        super().__init__(parent)
+        self.text = text
+        self.tokenizer = tokenizer
+        self.summarizer = summarizer
+        self.sentences_count = sentences_count
+
+    def run(self):
+        try:
+            # 1. Create a parser from the input text
+            parser = PlaintextParser.from_string(self.text, self.tokenizer)
+
+            # 2. Generate the summary
+            summary_sentences = self.summarizer(parser.document, self.sentences_count)
+
+            # 3. Join the summary sentences into a single string
+            summary = " ".join(str(sentence) for sentence in summary_sentences)
+
+            if not summary:
+                 summary = "Could not generate a summary. The input text may be too short."
+
+            # A newer request replaced this one, so its result is not wanted
+            if not self.isInterruptionRequested():
+                self.summary_ready.emit(summary)
+
+        except Exception as e:
+            self.failed.emit(f"An error occurred during summarization.\n\nError: {e}")
+
 
 class TextSummarizerApp(QMainWindow):
     def __init__(self):
@@ -25,6 +69,16 @@ class TextSummarizerApp(QMainWindow):
         self.setGeometry(100, 100, 800, 600)
         self.setWindowIcon(QIcon())
 
+        # --- Summarization Tools ---
+        # Built once per window; the tokenizer loads NLTK's punkt data, so it
+        # is created on the first Summarize click where a failure can be shown
+        self.tokenizer = None
+        # Stemmer reduces words to their root form
+        self.summarizer = Summarizer(Stemmer(LANGUAGE))
+        self.summarizer.stop_words = STOP_WORDS
+        # The worker of the latest Summarize click
+        self.worker = None
+
         # --- Central Widget and Layout ---
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -90,50 +144,77 @@ class TextSummarizerApp(QMainWindow):
     def upload_file(self):
         file_name, _ = QFileDialog.getOpenFileName(self, "Open Text File", "", "Text Files (*.txt)")
         if file_name:
+            # Stream the file into the editor piece by piece instead of holding
+            # the whole text as one extra Python string
+            self.input_text_edit.clear()
+            cursor = self.input_text_edit.textCursor()
+            cursor.beginEditBlock()
+            self.input_text_edit.setUpdatesEnabled(False)
+            truncated = False
             try:
-                with open(file_name, 'r', encoding='utf-8') as f:
-                    self.input_text_edit.setText(f.read())
+                with open(file_name, 'r', encoding='utf-8', errors='replace') as f:
+                    loaded = 0
+                    for chunk in iter(lambda: f.read(UPLOAD_CHUNK_CHARS), ''):
+                        chunk = chunk[:MAX_UPLOAD_CHARS - loaded]
+                        cursor.insertText(chunk)
+                        loaded += len(chunk)
+                        if loaded >= MAX_UPLOAD_CHARS:
+                            truncated = bool(f.read(1))
+                            break
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Could not read file: {e}")
+            finally:
+                cursor.endEditBlock()
+                self.input_text_edit.setUpdatesEnabled(True)
+            if truncated:
+                QMessageBox.warning(self, "Large File",
+                                    f"Only the first {MAX_UPLOAD_CHARS:,} characters of the file were loaded.")
 
     # --- UPDATED SUMMARIZATION FUNCTION ---
     def summarize_text(self):
-        """Performs the text summarization using the sumy library."""
+        """Starts summarizing the input text with sumy on a worker thread."""
         original_text = self.input_text_edit.toPlainText().strip()
 
         if not original_text:
             QMessageBox.warning(self, "Input Error", "Please enter or upload some text to summarize.")
             return
 
-        try:
-            # Language for summarization
-            LANGUAGE = "english"
-            # Number of sentences in the summary
-            SENTENCES_COUNT = 5
-
-            # 1. Create a parser from the input text
-            parser = PlaintextParser.from_string(original_text, Tokenizer(LANGUAGE))
-            
-            # 2. Create a stemmer (for reducing words to their root form)
-            stemmer = Stemmer(LANGUAGE)
-
-            # 3. Instantiate the summarizer algorithm
-            summarizer = Summarizer(stemmer)
-            summarizer.stop_words = get_stop_words(LANGUAGE)
-
-            # 4. Generate the summary
-            summary_sentences = summarizer(parser.document, SENTENCES_COUNT)
-
-            # 5. Join the summary sentences into a single string
-            summary = " ".join(str(sentence) for sentence in summary_sentences)
-            
-            if not summary:
-                 summary = "Could not generate a summary. The input text may be too short."
-
-            self.output_text_edit.setText(summary)
-
-        except Exception as e:
-            self.output_text_edit.setText(f"An error occurred during summarization.\n\nError: {e}")
+        if self.tokenizer is None:
+            try:
+                self.tokenizer = Tokenizer(LANGUAGE)
+            except Exception as e:
+                self.output_text_edit.setText(f"An error occurred during summarization.\n\nError: {e}")
+                return
+
+        # Only the latest click's result is shown; an older run can't be
+        # stopped midway, but it drops its result when it finishes
+        if self.worker is not None:
+            self.worker.requestInterruption()
+
+        self.worker = SumyWorker(original_text, self.tokenizer, self.summarizer, SENTENCES_COUNT, self)
+        self.worker.summary_ready.connect(self.on_summary_ready)
+        self.worker.failed.connect(self.on_summary_ready)
+        self.worker.finished.connect(self.on_worker_finished)
+        self.output_text_edit.setText("Summarizing...")
+        self.worker.start()
+
+    def on_summary_ready(self, text):
+        """Shows a worker's summary or error message, unless a newer request replaced it."""
+        if self.sender() is self.worker:
+            self.output_text_edit.setText(text)
+
+    def on_worker_finished(self):
+        """Releases a worker once its thread has stopped."""
+        worker = self.sender()
+        if worker is self.worker:
+            self.worker = None
+        worker.deleteLater()
+
+    def closeEvent(self, event):
+        """Waits for running summaries before the window goes away."""
+        for worker in self.findChildren(SumyWorker):
+            worker.wait()
+        super().closeEvent(event)
 
 
 if __name__ == '__main__':